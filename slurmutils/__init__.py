@@ -14,4 +14,36 @@
 
 """Utilities and APIs for interfacing with the Slurm workload manager."""
 
-from .utils import calculate_rs as calculate_rs
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import editors as editors
+    from . import exceptions as exceptions
+    from . import models as models
+    from .utils import calculate_rs as calculate_rs
+
+# Subpackages are imported on first access, e.g. `slurmutils.editors`, so that
+# `import slurmutils` stays cheap for short-lived processes.
+_submodules = {"editors", "exceptions", "models"}
+_exports = {"calculate_rs": ".utils"}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str) -> Any:
+    """Import subpackage or utility `name` on first access."""
+    if name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _exports:
+        value = getattr(importlib.import_module(_exports[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including subpackages that have not been imported yet."""
+    return sorted({*globals(), *_submodules, *_exports})
@@ -14,8 +14,38 @@
 
 """Editors for Slurm workload manager configuration files."""
 
-from . import acctgatherconfig as acctgatherconfig
-from . import cgroupconfig as cgroupconfig
-from . import gresconfig as gresconfig
-from . import slurmconfig as slurmconfig
-from . import slurmdbdconfig as slurmdbdconfig
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import acctgatherconfig as acctgatherconfig
+    from . import cgroupconfig as cgroupconfig
+    from . import gresconfig as gresconfig
+    from . import slurmconfig as slurmconfig
+    from . import slurmdbdconfig as slurmdbdconfig
+    from .editor import transaction as transaction
+
+# Editors are imported on first access so that using one editor does not pay
+# for importing the data models of all the others.
+_submodules = {"acctgatherconfig", "cgroupconfig", "gresconfig", "slurmconfig", "slurmdbdconfig"}
+_exports = {"transaction": ".editor"}
+
+__all__ = [*sorted(_submodules), *_exports]
+
+
+def __getattr__(name: str) -> Any:
+    """Import editor `name` on first access."""
+    if name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _exports:
+        value = getattr(importlib.import_module(_exports[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including editors that have not been imported yet."""
+    return sorted({*globals(), *_submodules, *_exports})
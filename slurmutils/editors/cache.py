@@ -0,0 +1,295 @@
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Cache of data models loaded from Slurm workload manager configuration files."""
+
+import hashlib
+import logging
+import os
+import pickle
+import stat
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from ..models.model import get_intern_table, get_validation_level
+
+_logger = logging.getLogger("slurmutils")
+
+
+# Version stamp is looked up on first use since reading package metadata is slow.
+_SNAPSHOT_STAMP: Optional[bytes] = None
+
+
+def _snapshot_stamp() -> bytes:
+    """Get version stamp that on-disk snapshots must match to be loaded."""
+    global _SNAPSHOT_STAMP
+    if _SNAPSHOT_STAMP is None:
+        from importlib import metadata
+
+        try:
+            version = metadata.version("slurmutils")
+        except metadata.PackageNotFoundError:
+            version = "unknown"
+
+        python = f"py{sys.version_info[0]}.{sys.version_info[1]}"
+        _SNAPSHOT_STAMP = f"slurmutils-snapshot/1 {version} {python}".encode()
+
+    return _SNAPSHOT_STAMP
+
+
+class ModelCache:
+    """Process-wide LRU cache of data models loaded from configuration files.
+
+    Args:
+        max_entries: Maximum number of cached data models. `0` disables the cache. (Default: 0)
+        max_bytes: Maximum total size of the cached data models in bytes.
+        snapshot_dir: Directory to persist snapshots of data models in so that they
+            can be reused by other processes. (Default: None)
+
+    Notes:
+        Data models are cached as pickled snapshots, so every cache hit returns a new,
+        independent data model that callers can freely mutate. A cached data model is
+        only returned while the inode, size, and modification time of its source file
+        are unchanged.
+
+        The cache is disabled by default since every cache miss pickles the loaded data
+        model. Enable the process-wide cache with, e.g. `model_cache.max_entries = 32`,
+        when the same configuration files are loaded repeatedly.
+
+        Snapshots persisted in `snapshot_dir` are keyed by a hash of the contents of
+        their source file and stamped with the version of slurmutils that wrote them.
+        They are rewritten when either changes.
+
+    Warnings:
+        * Snapshots are unpickled when loaded, so a snapshot is ignored unless both it
+            and `snapshot_dir` are owned by the effective user and are not writable by
+            group or others.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 0,
+        max_bytes: int = 32 * 1024 * 1024,
+        snapshot_dir: Optional[Union[str, os.PathLike]] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.snapshot_dir = snapshot_dir
+        self.hits = 0
+        self.misses = 0
+        self.snapshot_hits = 0
+        # Map of cache keys to source file path, source file identity, and snapshot.
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:  # noqa D105
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Get total size of the cached data models in bytes."""
+        return self._size
+
+    def get(self, key: Hashable, identity: Tuple[int, int, int]) -> Optional[Any]:
+        """Get a copy of a cached data model.
+
+        Args:
+            key: Cache key of the data model.
+            identity: Inode, size, and modification time of the data model's source file.
+
+        Returns:
+            `None` if the data model is not cached or its source file has changed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != identity:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return pickle.loads(entry[2])
+
+    def put(self, key: Hashable, path: str, identity: Tuple[int, int, int], model: Any) -> None:
+        """Cache a snapshot of a data model.
+
+        Args:
+            key: Cache key of the data model.
+            path: Path of the data model's source file.
+            identity: Inode, size, and modification time of the data model's source file.
+            model: Data model to cache.
+        """
+        if self.max_entries <= 0:
+            return
+
+        snapshot = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(snapshot) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (path, identity, snapshot)
+            self._size += len(snapshot)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, file: Optional[Union[str, os.PathLike]] = None) -> None:
+        """Drop cached data models.
+
+        Args:
+            file: Only drop data models loaded from this file. (Default: drop all)
+        """
+        with self._lock:
+            if file is None:
+                self._entries.clear()
+                self._size = 0
+                return
+
+            path = os.path.realpath(file)
+            for key in [k for k, entry in self._entries.items() if entry[0] == path]:
+                self._remove(key)
+
+    def read_snapshot(self, key: Hashable, content: bytes) -> Optional[Any]:
+        """Load a data model from its on-disk snapshot.
+
+        Args:
+            key: Cache key of the data model.
+            content: Current contents of the data model's source file.
+
+        Returns:
+            `None` if there is no snapshot matching `content` and the installed slurmutils.
+        """
+        if self.snapshot_dir is None:
+            return None
+
+        target = self._snapshot_path(key)
+        try:
+            with open(target, "rb") as fin:
+                if not (_trusted(os.fstat(fin.fileno())) and _trusted(os.stat(target.parent))):
+                    _logger.warning("ignoring untrusted snapshot %s", target)
+                    return None
+
+                stamp = fin.readline().rstrip(b"\n")
+                digest = fin.readline().rstrip(b"\n")
+                if stamp != _snapshot_stamp() or digest != _digest(content):
+                    return None
+
+                model = pickle.load(fin)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            _logger.debug("ignoring unreadable snapshot %s. reason: %s", target, e)
+            return None
+
+        self.snapshot_hits += 1
+        return model
+
+    def write_snapshot(self, key: Hashable, content: bytes, model: Any) -> None:
+        """Persist a data model as an on-disk snapshot.
+
+        Args:
+            key: Cache key of the data model.
+            content: Contents of the source file the data model was loaded from.
+            model: Data model to persist.
+        """
+        if self.snapshot_dir is None:
+            return
+
+        target = self._snapshot_path(key)
+        try:
+            target.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+            try:
+                with os.fdopen(fd, "wb") as fout:
+                    fout.write(_snapshot_stamp() + b"\n" + _digest(content) + b"\n")
+                    pickle.dump(model, fout, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, target)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            _logger.debug("failed to write snapshot %s. reason: %s", target, e)
+
+    def _snapshot_path(self, key: Hashable) -> Path:
+        """Get path of the on-disk snapshot for a cache key."""
+        return Path(self.snapshot_dir) / hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry from the cache. The cache lock must be held."""
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._size -= len(entry[2])
+
+
+model_cache = ModelCache()
+
+
+def _trusted(info: os.stat_result) -> bool:
+    """Check that a snapshot file or directory can only be modified by the effective user."""
+    return info.st_uid == os.geteuid() and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _digest(content: bytes) -> bytes:
+    """Get hex digest of configuration file contents."""
+    return hashlib.sha256(content).hexdigest().encode()
+
+
+def cache_key(
+    func: Callable[..., Any], path: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Optional[Hashable]:
+    """Get cache key of a call to a loader function.
+
+    Args:
+        func: Loader function.
+        path: Real path of the configuration file to load.
+        args: Positional arguments passed to the loader after the file.
+        kwargs: Keyword arguments passed to the loader.
+
+    Returns:
+        `None` if the loaded data model must not be cached.
+    """
+    # Cached copies cannot share values through an intern table, so interned
+    # loads bypass the cache. The validation level changes what a load accepts.
+    if get_intern_table() is not None:
+        return None
+
+    key = (
+        func.__module__,
+        func.__qualname__,
+        path,
+        get_validation_level(),
+        tuple(_freeze(arg) for arg in args),
+        tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _freeze(value: Any) -> Any:
+    """Convert loader arguments into a hashable form for use in cache keys."""
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    if isinstance(value, list):
+        return tuple(value)
+
+    return value
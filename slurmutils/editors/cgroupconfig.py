@@ -14,29 +14,59 @@
 
 """Edit cgroup.conf files."""
 
-__all__ = ["dump", "dumps", "load", "loads", "edit"]
+__all__ = ["dump", "dumps", "load", "loads", "edit", "adump", "aload", "aedit"]
 
 import logging
 import os
-from contextlib import contextmanager
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Iterable, Optional, Union
 
 from ..models import CgroupConfig
-from .editor import dumper, loader, set_file_permissions
+from ..models.model import validation_level
+from .editor import (
+    AsyncEditContext,
+    EditContext,
+    atomic_write,
+    dumper,
+    loader,
+    run_in_executor,
+)
 
 _logger = logging.getLogger("slurmutils")
 
 
 @loader
-def load(file: Union[str, os.PathLike]) -> CgroupConfig:
-    """Load `cgroup.conf` data model from cgroup.conf file."""
-    return loads(Path(file).read_text())
+def load(
+    file: Union[str, os.PathLike],
+    *,
+    keys: Optional[Iterable[str]] = None,
+    validation: Optional[str] = None,
+) -> CgroupConfig:
+    """Load `cgroup.conf` data model from cgroup.conf file.
 
+    Args:
+        file: cgroup.conf file to load.
+        keys: Only load these configuration options.
+        validation: Validation level to load with, `strict`, `fast` or `off`.
+            (Default: process-wide validation level)
+    """
+    return loads(Path(file).read_text(), keys=keys, validation=validation)
 
-def loads(content: str) -> CgroupConfig:
-    """Load `cgroup.conf` data model from string."""
-    return CgroupConfig.from_str(content)
+
+def loads(
+    content: str, *, keys: Optional[Iterable[str]] = None, validation: Optional[str] = None
+) -> CgroupConfig:
+    """Load `cgroup.conf` data model from string.
+
+    Args:
+        content: cgroup.conf content to load.
+        keys: Only load these configuration options.
+        validation: Validation level to load with, `strict`, `fast` or `off`.
+            (Default: process-wide validation level)
+    """
+    with validation_level(validation):
+        return CgroupConfig.from_str(content, keys=keys)
 
 
 @dumper
@@ -46,10 +76,23 @@ def dump(
     mode: int = 0o644,
     user: Optional[Union[str, int]] = None,
     group: Optional[Union[str, int]] = None,
+    *,
+    durability: Optional[str] = None,
 ) -> None:
-    """Dump `cgroup.conf` data model into cgroup.conf file."""
-    Path(file).write_text(dumps(config))
-    set_file_permissions(file, mode, user, group)
+    """Dump `cgroup.conf` data model into cgroup.conf file.
+
+    The file is replaced atomically, so readers never observe a partially written
+    cgroup.conf file or one with the wrong permissions.
+
+    Args:
+        config: `cgroup.conf` data model to dump.
+        file: cgroup.conf file to write.
+        mode: Access mode to apply to the cgroup.conf file. (Default: rw-r--r--)
+        user: User to set as owner of the cgroup.conf file. (Default: $USER)
+        group: Group to set as owner of the cgroup.conf file. (Default: None)
+        durability: Durability level of the write. (Default: process-wide durability level)
+    """
+    atomic_write(file, config.iter_lines(), mode, user, group, durability=durability)
 
 
 def dumps(config: CgroupConfig) -> str:
@@ -57,26 +100,90 @@ def dumps(config: CgroupConfig) -> str:
     return str(config)
 
 
-@contextmanager
 def edit(
     file: Union[str, os.PathLike],
     mode: int = 0o644,
     user: Optional[Union[str, int]] = None,
     group: Optional[Union[str, int]] = None,
-) -> CgroupConfig:
+    *,
+    timeout: Optional[float] = None,
+) -> EditContext:
     """Edit a cgroup.conf file.
 
+    An exclusive lock on the cgroup.conf file is held for the whole edit, so concurrent
+    edits do not overwrite each other. The cgroup.conf file is only rewritten if the data
+    model was changed. The `written` attribute of the returned context manager reports
+    whether a write happened.
+
+    Args:
+        file: cgroup.conf file to edit. An empty config will be created if it does not exist.
+        mode: Access mode to apply to the cgroup.conf file. (Default: rw-r--r--)
+        user: User to set as owner of the cgroup.conf file. (Default: $USER)
+        group: Group to set as owner of the cgroup.conf file. (Default: None)
+        timeout: Seconds to wait for the lock. Wait forever if `None`. (Default: None)
+    """
+    return EditContext(file, CgroupConfig, mode, user, group, timeout=timeout)
+
+
+async def aload(
+    file: Union[str, os.PathLike], *, executor: Optional[Executor] = None, **kwargs: Any
+) -> CgroupConfig:
+    """Load `cgroup.conf` data model from cgroup.conf file without blocking the event loop.
+
+    Args:
+        file: cgroup.conf file to load.
+        executor: Executor to load the cgroup.conf file on. (Default: process-wide executor)
+        **kwargs: Keyword arguments to pass to `load`.
+    """
+    return await run_in_executor(load, file, executor=executor, **kwargs)
+
+
+async def adump(
+    config: CgroupConfig,
+    file: Union[str, os.PathLike],
+    mode: int = 0o644,
+    user: Optional[Union[str, int]] = None,
+    group: Optional[Union[str, int]] = None,
+    *,
+    durability: Optional[str] = None,
+    executor: Optional[Executor] = None,
+) -> None:
+    """Dump `cgroup.conf` data model into cgroup.conf file without blocking the event loop.
+
+    Args:
+        config: `cgroup.conf` data model to dump.
+        file: cgroup.conf file to write.
+        mode: Access mode to apply to the cgroup.conf file. (Default: rw-r--r--)
+        user: User to set as owner of the cgroup.conf file. (Default: $USER)
+        group: Group to set as owner of the cgroup.conf file. (Default: None)
+        durability: Durability level of the write. (Default: process-wide durability level)
+        executor: Executor to write the cgroup.conf file on. (Default: process-wide executor)
+    """
+    await run_in_executor(
+        dump, config, file, mode, user, group, durability=durability, executor=executor
+    )
+
+
+def aedit(
+    file: Union[str, os.PathLike],
+    mode: int = 0o644,
+    user: Optional[Union[str, int]] = None,
+    group: Optional[Union[str, int]] = None,
+    *,
+    timeout: Optional[float] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncEditContext:
+    """Edit a cgroup.conf file without blocking the event loop.
+
+    See `edit` for details. Use as `async with aedit(...) as config`.
+
     Args:
         file: cgroup.conf file to edit. An empty config will be created if it does not exist.
         mode: Access mode to apply to the cgroup.conf file. (Default: rw-r--r--)
         user: User to set as owner of the cgroup.conf file. (Default: $USER)
         group: Group to set as owner of the cgroup.conf file. (Default: None)
+        timeout: Seconds to wait for the lock. Wait forever if `None`. (Default: None)
+        executor: Executor to load and write the cgroup.conf file on.
+            (Default: process-wide executor)
     """
-    if not os.path.exists(file):
-        _logger.warning("file %s not found. creating new empty cgroup.conf configuration", file)
-        config = CgroupConfig()
-    else:
-        config = load(file)
-
-    yield config
-    dump(config, file, mode, user, group)
+    return AsyncEditContext(edit(file, mode, user, group, timeout=timeout), executor)
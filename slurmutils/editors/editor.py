@@ -14,16 +14,166 @@
 
 """Base methods for Slurm workload manager configuration file editors."""
 
+import contextvars
+import grp
 import logging
 import os
+import pwd
 import shutil
-from functools import wraps
+import stat
+import sys
+import tempfile
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import partial, wraps
 from pathlib import Path
-from typing import Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .cache import cache_key, model_cache
+from .lock import aflock, file_lock
 
 _logger = logging.getLogger("slurmutils")
 
 
+def write_lines(fout: TextIO, lines: Iterable[str], end: str = "") -> None:
+    """Stream configuration lines into a file.
+
+    Args:
+        fout: Text stream to write lines to.
+        lines: Configuration lines to write. Lines are separated by newlines.
+        end: String to write after the last line. (Default: "")
+    """
+    lines = iter(lines)
+    for line in lines:
+        fout.write(line)
+        break
+    for line in lines:
+        fout.write("\n")
+        fout.write(line)
+    fout.write(end)
+
+
+DURABILITY_LEVELS = ("none", "file", "full")
+_durability = "full"
+
+
+def set_durability(level: str) -> None:
+    """Set the process-wide durability level of configuration file writes.
+
+    Args:
+        level: Durability level to apply when `dump` is not given one.
+            * `full`: fsync the written file and its parent directory.
+            * `file`: fsync the written file only.
+            * `none`: skip fsync calls. Writes are still atomic, but may be lost
+                on power failure. Useful for bulk tooling that syncs by itself.
+
+    Raises:
+        ValueError: Raised if `level` is not a valid durability level.
+    """
+    global _durability
+    _durability = _check_durability(level)
+
+
+def _check_durability(level: str) -> str:
+    """Check that a durability level is valid."""
+    if level not in DURABILITY_LEVELS:
+        raise ValueError(
+            f"invalid durability level {level!r}. valid levels are {list(DURABILITY_LEVELS)}"
+        )
+
+    return level
+
+
+def atomic_write(
+    file: Union[str, os.PathLike],
+    lines: Iterable[str],
+    mode: int = 0o644,
+    user: Optional[Union[str, int]] = None,
+    group: Optional[Union[str, int]] = None,
+    *,
+    end: str = "",
+    durability: Optional[str] = None,
+) -> None:
+    """Atomically replace the contents of a configuration file.
+
+    Lines are written to a temporary file next to `file` that already has the requested
+    access mode and owner. The temporary file is then renamed over `file`, so readers
+    only ever see either the old or the new contents with the correct permissions.
+
+    Args:
+        file: File to write.
+        lines: Configuration lines to write.
+        mode: Access mode to apply to file. (Default: rw-r--r--)
+        user: User to set as owner of file. (Default: $USER)
+        group: Group to set as owner of file. (Default: None)
+        end: String to write after the last line. (Default: "")
+        durability: Durability level of the write. See `set_durability` for the
+            available levels. (Default: process-wide durability level)
+    """
+    durability = _durability if durability is None else _check_durability(durability)
+    target, tmp = _stage_write(file, lines, mode, user, group, end=end, durability=durability)
+    try:
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    if durability == "full":
+        _fsync_dir(target.parent)
+
+
+def _stage_write(
+    file: Union[str, os.PathLike],
+    lines: Iterable[str],
+    mode: int,
+    user: Optional[Union[str, int]],
+    group: Optional[Union[str, int]],
+    *,
+    end: str,
+    durability: str,
+) -> Tuple[Path, str]:
+    """Write configuration lines into a temporary file next to the target file.
+
+    Returns:
+        The resolved target file and the temporary file to rename over it.
+    """
+    # Replace the target of a symlink rather than the symlink itself.
+    target = Path(os.path.realpath(file))
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "w") as fout:
+            set_file_permissions(tmp, mode, user, group)
+            write_lines(fout, lines, end)
+            if durability != "none":
+                fout.flush()
+                os.fsync(fout.fileno())
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    return target, tmp
+
+
+def _fsync_dir(path: Union[str, os.PathLike]) -> None:
+    """Flush directory entries to disk."""
+    dirfd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(dirfd)
+    finally:
+        os.close(dirfd)
+
+
 def set_file_permissions(
     file: Union[str, os.PathLike],
     mode: int = 0o644,
@@ -44,17 +194,387 @@ def set_file_permissions(
     shutil.chown(file, user, group)
 
 
+_executor: Optional[Executor] = None
+
+
+def set_executor(executor: Optional[Executor]) -> None:
+    """Set the process-wide executor of asynchronous editor functions.
+
+    Args:
+        executor: Executor to run file I/O and parsing on. `None` uses the default
+            executor of the running event loop.
+    """
+    global _executor
+    _executor = executor
+
+
+async def run_in_executor(
+    func: Callable[..., Any], *args: Any, executor: Optional[Executor] = None, **kwargs: Any
+) -> Any:
+    """Run a blocking editor function on an executor without blocking the event loop.
+
+    Args:
+        func: Function to run.
+        *args: Positional arguments to pass to `func`.
+        executor: Executor to run `func` on. (Default: process-wide executor)
+        **kwargs: Keyword arguments to pass to `func`.
+
+    Notes:
+        `func` runs in a copy of the caller's context, so settings such as
+        `validation_level` and `interning` blocks apply to it.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    run = partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(executor or _executor, run)
+
+
+def _has_file_permissions(
+    file: Union[str, os.PathLike],
+    mode: int = 0o644,
+    user: Optional[Union[str, int]] = None,
+    group: Optional[Union[str, int]] = None,
+) -> bool:
+    """Check if file permissions are already applied to configuration file."""
+    info = os.stat(file)
+    if stat.S_IMODE(info.st_mode) != mode:
+        return False
+
+    try:
+        uid = os.getuid() if user is None else user
+        if isinstance(uid, str):
+            uid = pwd.getpwnam(uid).pw_uid
+        gid = info.st_gid if group is None else group
+        if isinstance(gid, str):
+            gid = grp.getgrnam(gid).gr_gid
+    except KeyError:
+        return False
+
+    return info.st_uid == uid and info.st_gid == gid
+
+
+class EditContext:
+    """Context manager that edits a configuration file.
+
+    The configuration file is only rewritten on exit if the rendered data model differs
+    from the original contents of the file. If the contents are unchanged, the access
+    mode and owner are only reapplied when they differ from the requested ones.
+
+    Args:
+        file: Configuration file to edit. An empty config will be created if it does not exist.
+        model: Data model of the configuration file.
+        mode: Access mode to apply to the configuration file. (Default: rw-r--r--)
+        user: User to set as owner of the configuration file. (Default: $USER)
+        group: Group to set as owner of the configuration file. (Default: None)
+        timeout: Seconds to wait for the exclusive lock on the configuration file that is
+            held for the whole edit. Wait forever if `None`. (Default: None)
+
+    Attributes:
+        written: Whether the configuration file was written when the context exited.
+            `None` until the context exits.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, os.PathLike],
+        model: Type[Any],
+        mode: int = 0o644,
+        user: Optional[Union[str, int]] = None,
+        group: Optional[Union[str, int]] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.file = file
+        self.mode = mode
+        self.user = user
+        self.group = group
+        self.timeout = timeout
+        self.written: Optional[bool] = None
+        self._model = model
+        self._config = None
+        self._original: Optional[str] = None
+        self._lock = None
+
+    def __enter__(self) -> Any:
+        """Lock the configuration file and load its data model."""
+        self._lock = file_lock(self.file, timeout=self.timeout)
+        self._lock.__enter__()
+        try:
+            self._config = self._load()
+        except BaseException:
+            self._lock.__exit__(*sys.exc_info())
+            raise
+
+        return self._config
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Write data model back into the configuration file if it has changed."""
+        try:
+            self._write(exc_type)
+        finally:
+            self._lock.__exit__(exc_type, exc_value, traceback)
+
+    def _load(self) -> Any:
+        """Load data model from the configuration file."""
+        try:
+            self._original = Path(self.file).read_text()
+        except FileNotFoundError:
+            _logger.warning(
+                "file %s not found. creating new empty %s configuration",
+                self.file,
+                self._model.__name__,
+            )
+            return self._model()
+
+        return self._model.from_str(self._original)
+
+    def _write(self, exc_type) -> None:
+        """Write data model into the configuration file."""
+        if exc_type is not None:
+            self.written = False
+            return
+
+        if (content := self._render()) is None:
+            self._apply_permissions()
+            self.written = False
+            return
+
+        _logger.debug("updating contents of %s", self.file)
+        try:
+            atomic_write(self.file, [content], self.mode, self.user, self.group)
+        finally:
+            model_cache.invalidate(self.file)
+        self.written = True
+
+    def _render(self) -> Optional[str]:
+        """Render data model, or return `None` if the configuration file is unchanged."""
+        content = str(self._config)
+        if content == self._original:
+            _logger.debug("contents of %s are unchanged. skipping write", self.file)
+            return None
+
+        return content
+
+    def _apply_permissions(self) -> None:
+        """Reapply access mode and owner to an unchanged configuration file if needed."""
+        if not _has_file_permissions(self.file, self.mode, self.user, self.group):
+            set_file_permissions(self.file, self.mode, self.user, self.group)
+
+
+class AsyncEditContext:
+    """Asynchronous context manager that edits a configuration file.
+
+    The exclusive lock on the configuration file is awaited on the event loop, while
+    loading and writing the configuration file run on an executor, so neither blocks
+    the event loop or ties up executor threads while waiting for the lock.
+
+    Args:
+        edit: Edit to run asynchronously.
+        executor: Executor to run the edit on. (Default: process-wide executor)
+
+    Warnings:
+        * Do not load the edited configuration file within the `async with` block.
+            Loads wait for a shared lock, which cannot be acquired until the edit exits.
+    """
+
+    def __init__(self, edit: EditContext, executor: Optional[Executor] = None) -> None:
+        self._edit = edit
+        self._executor = executor
+        self._fd: Optional[int] = None
+
+    @property
+    def written(self) -> Optional[bool]:
+        """Whether the configuration file was written when the context exited."""
+        return self._edit.written
+
+    async def __aenter__(self) -> Any:
+        """Lock the configuration file and load its data model."""
+        edit = self._edit
+        self._fd = await aflock(edit.file, edit.timeout)
+        try:
+            edit._config = await run_in_executor(edit._load, executor=self._executor)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+        return edit._config
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Write data model back into the configuration file if it has changed."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor or _executor, self._edit._write, exc_type)
+        # Hold the lock until the write has finished, even if the caller is cancelled.
+        fd = self._fd
+        future.add_done_callback(lambda _: os.close(fd))
+        await asyncio.shield(future)
+
+
+@contextmanager
+def transaction(
+    *edits: EditContext, durability: Optional[str] = None
+) -> Iterator[Tuple[Any, ...]]:
+    """Edit several configuration files together.
+
+    All configuration files are locked and loaded in parallel on entry. On exit, every
+    changed file is written to a temporary file first, and the temporary files are only
+    renamed over their targets once all of them have been written. If the block raises,
+    or a configuration file fails to render or write, no configuration file is changed.
+
+    Args:
+        edits: Edits to apply together, e.g. `slurmconfig.edit("/etc/slurm/slurm.conf")`.
+        durability: Durability level of the writes. (Default: process-wide durability level)
+
+    Yields:
+        The data models of the edited configuration files, in the order of `edits`.
+
+    Raises:
+        ValueError: Raised if a configuration file is edited more than once.
+
+    Warnings:
+        * Renames can only be undone on a best-effort basis. If renaming a temporary
+            file fails, configuration files that have already been replaced are
+            restored from their original contents.
+
+    Examples:
+        >>> with transaction(
+        ...     slurmconfig.edit("/etc/slurm/slurm.conf"),
+        ...     gresconfig.edit("/etc/slurm/gres.conf"),
+        ... ) as (slurm, gres):
+        ...     ...
+    """
+    durability = _durability if durability is None else _check_durability(durability)
+    paths = [os.path.realpath(edit.file) for edit in edits]
+    if len(set(paths)) != len(paths):
+        raise ValueError("cannot edit the same configuration file more than once")
+
+    with ExitStack() as stack:
+        # Lock in a consistent order so that concurrent transactions cannot deadlock.
+        for _, edit in sorted(zip(paths, edits), key=lambda x: x[0]):
+            stack.enter_context(file_lock(edit.file, timeout=edit.timeout))
+
+        # Each load runs in a copy of the caller's context so that it sees the caller's
+        # intern table and validation level.
+        contexts = [contextvars.copy_context() for _ in edits]
+        with ThreadPoolExecutor(max_workers=max(len(edits), 1)) as pool:
+            configs = tuple(pool.map(lambda ctx, edit: ctx.run(edit._load), contexts, edits))
+        for edit, config in zip(edits, configs):
+            edit._config = config
+            edit.written = False
+
+        yield configs
+
+        staged = []
+        try:
+            for edit in edits:
+                if (content := edit._render()) is not None:
+                    target, tmp = _stage_write(
+                        edit.file,
+                        [content],
+                        edit.mode,
+                        edit.user,
+                        edit.group,
+                        end="",
+                        durability=durability,
+                    )
+                    staged.append((edit, target, tmp))
+        except BaseException:
+            for _, _, tmp in staged:
+                os.unlink(tmp)
+            raise
+
+        _commit_staged(staged, durability)
+        for edit in edits:
+            if edit.written is False:
+                edit._apply_permissions()
+
+
+def _commit_staged(staged: List[Tuple[EditContext, Path, str]], durability: str) -> None:
+    """Rename staged temporary files over their targets, all or nothing."""
+    committed = 0
+    try:
+        for edit, target, tmp in staged:
+            os.replace(tmp, target)
+            edit.written = True
+            committed += 1
+    except BaseException:
+        for edit, target, _ in staged[:committed]:
+            _restore(edit, target)
+        for _, _, tmp in staged[committed:]:
+            os.unlink(tmp)
+        raise
+    finally:
+        for edit, _, _ in staged:
+            model_cache.invalidate(edit.file)
+
+    if durability == "full":
+        for parent in {target.parent for _, target, _ in staged}:
+            _fsync_dir(parent)
+
+
+def _restore(edit: EditContext, target: Path) -> None:
+    """Restore the original contents of a replaced configuration file."""
+    edit.written = False
+    try:
+        if edit._original is None:
+            target.unlink()
+        else:
+            atomic_write(target, [edit._original], edit.mode, edit.user, edit.group)
+    except OSError as e:
+        _logger.error("failed to restore original contents of %s. reason: %s", target, e)
+
+
 def loader(func):
-    """Wrap function that loads configuration data from file."""
+    """Wrap function that loads configuration data from file.
+
+    Notes:
+        The module of `func` must define a `loads` function that takes the same options
+        as `func`. It is used to parse file contents that were already read and hashed
+        to look up a snapshot, so the snapshot written matches the parsed contents.
+    """
 
     @wraps(func)
     def wrapper(*args, **kwargs):
         fin = args[0]
-        if not os.path.exists(fin):
+        try:
+            # Stat before reading so that a concurrent write yields a stale identity,
+            # which forces a reload on the next call, rather than a stale data model.
+            info = os.stat(fin)
+        except FileNotFoundError:
             raise FileNotFoundError(f"could not locate {fin}")
 
-        _logger.debug("reading contents of %s", fin)
-        return func(*args, **kwargs)
+        path = os.path.realpath(fin)
+        identity = (info.st_ino, info.st_size, info.st_mtime_ns)
+        key = cache_key(func, path, args[1:], kwargs)
+
+        if key is not None and (model := model_cache.get(key, identity)) is not None:
+            _logger.debug("using cached contents of %s", fin)
+            return model
+
+        with file_lock(fin, shared=True):
+            content = None
+            if key is not None and model_cache.snapshot_dir is not None:
+                content = Path(fin).read_bytes()
+                if (model := model_cache.read_snapshot(key, content)) is not None:
+                    _logger.debug("using snapshot of contents of %s", fin)
+                    model_cache.put(key, path, identity, model)
+                    return model
+
+            _logger.debug("reading contents of %s", fin)
+            if content is None:
+                model = func(*args, **kwargs)
+            else:
+                loads = sys.modules[func.__module__].loads
+                model = loads(content.decode(), *args[1:], **kwargs)
+
+        if key is not None:
+            model_cache.put(key, path, identity, model)
+            if content is not None:
+                model_cache.write_snapshot(key, content, model)
+
+        return model
 
     return wrapper
 
@@ -69,6 +589,9 @@ def dumper(func):
             _logger.debug("overwriting current contents of %s", fout)
 
         _logger.debug("updating contents of %s", fout)
-        return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            model_cache.invalidate(fout)
 
     return wrapper
@@ -14,29 +14,66 @@
 
 """Edit gres.conf files."""
 
-__all__ = ["dump", "dumps", "load", "loads", "edit"]
+__all__ = ["dump", "dumps", "load", "loads", "edit", "adump", "aload", "aedit"]
 
 import logging
 import os
-from contextlib import contextmanager
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Iterable, Optional, Union
 
 from ..models import GRESConfig
-from .editor import dumper, loader, set_file_permissions
+from ..models.model import validation_level
+from .editor import (
+    AsyncEditContext,
+    EditContext,
+    atomic_write,
+    dumper,
+    loader,
+    run_in_executor,
+)
 
 _logger = logging.getLogger("slurmutils")
 
 
 @loader
-def load(file: Union[str, os.PathLike]) -> GRESConfig:
-    """Load `gres.conf` data model from gres.conf file."""
-    return loads(Path(file).read_text())
+def load(
+    file: Union[str, os.PathLike],
+    *,
+    sections: Optional[Iterable[str]] = None,
+    keys: Optional[Iterable[str]] = None,
+    validation: Optional[str] = None,
+) -> GRESConfig:
+    """Load `gres.conf` data model from gres.conf file.
 
+    Args:
+        file: gres.conf file to load.
+        sections: Only load these sections, `Names` and/or `Nodes`.
+        keys: Only load these global options, e.g. `AutoDetect`.
+        validation: Validation level to load with, `strict`, `fast` or `off`.
+            (Default: process-wide validation level)
+    """
+    return loads(Path(file).read_text(), sections=sections, keys=keys, validation=validation)
 
-def loads(content: str) -> GRESConfig:
-    """Load `gres.conf` data model from string."""
-    return GRESConfig.from_str(content)
+
+def loads(
+    content: str,
+    *,
+    sections: Optional[Iterable[str]] = None,
+    keys: Optional[Iterable[str]] = None,
+    validation: Optional[str] = None,
+) -> GRESConfig:
+    """Load `gres.conf` data model from string.
+
+    Args:
+        content: gres.conf content to load.
+        sections: Only load these sections, `Names` and/or `Nodes`.
+        keys: Only load these global options, e.g. `AutoDetect`.
+        validation: Validation level to load with, `strict`, `fast` or `off`.
+            (Default: process-wide validation level)
+    """
+    with validation_level(validation):
+        return GRESConfig.from_str(content, sections=sections, keys=keys)
 
 
 @dumper
@@ -46,10 +83,23 @@ def dump(
     mode: int = 0o644,
     user: Optional[Union[str, int]] = None,
     group: Optional[Union[str, int]] = None,
+    *,
+    durability: Optional[str] = None,
 ) -> None:
-    """Dump `gres.conf` data model into gres.conf file."""
-    Path(file).write_text(dumps(config))
-    set_file_permissions(file, mode, user, group)
+    """Dump `gres.conf` data model into gres.conf file.
+
+    The file is replaced atomically, so readers never observe a partially written
+    gres.conf file or one with the wrong permissions.
+
+    Args:
+        config: `gres.conf` data model to dump.
+        file: gres.conf file to write.
+        mode: Access mode to apply to the gres.conf file. (Default: rw-r--r--)
+        user: User to set as owner of the gres.conf file. (Default: $USER)
+        group: Group to set as owner of the gres.conf file. (Default: None)
+        durability: Durability level of the write. (Default: process-wide durability level)
+    """
+    atomic_write(file, config.iter_lines(), mode, user, group, end="\n", durability=durability)
 
 
 def dumps(config: GRESConfig) -> str:
@@ -57,26 +107,90 @@ def dumps(config: GRESConfig) -> str:
     return str(config)
 
 
-@contextmanager
 def edit(
     file: Union[str, os.PathLike],
     mode: int = 0o644,
     user: Optional[Union[str, int]] = None,
     group: Optional[Union[str, int]] = None,
-) -> GRESConfig:
+    *,
+    timeout: Optional[float] = None,
+) -> EditContext:
     """Edit a gres.conf file.
 
+    An exclusive lock on the gres.conf file is held for the whole edit, so concurrent
+    edits do not overwrite each other. The gres.conf file is only rewritten if the data
+    model was changed. The `written` attribute of the returned context manager reports
+    whether a write happened.
+
+    Args:
+        file: gres.conf file to edit. An empty config will be created if it does not exist.
+        mode: Access mode to apply to the gres.conf file. (Default: rw-r--r--)
+        user: User to set as owner of the gres.conf file. (Default: $USER)
+        group: Group to set as owner of the gres.conf file. (Default: None)
+        timeout: Seconds to wait for the lock. Wait forever if `None`. (Default: None)
+    """
+    return EditContext(file, GRESConfig, mode, user, group, timeout=timeout)
+
+
+async def aload(
+    file: Union[str, os.PathLike], *, executor: Optional[Executor] = None, **kwargs: Any
+) -> GRESConfig:
+    """Load `gres.conf` data model from gres.conf file without blocking the event loop.
+
+    Args:
+        file: gres.conf file to load.
+        executor: Executor to load the gres.conf file on. (Default: process-wide executor)
+        **kwargs: Keyword arguments to pass to `load`.
+    """
+    return await run_in_executor(load, file, executor=executor, **kwargs)
+
+
+async def adump(
+    config: GRESConfig,
+    file: Union[str, os.PathLike],
+    mode: int = 0o644,
+    user: Optional[Union[str, int]] = None,
+    group: Optional[Union[str, int]] = None,
+    *,
+    durability: Optional[str] = None,
+    executor: Optional[Executor] = None,
+) -> None:
+    """Dump `gres.conf` data model into gres.conf file without blocking the event loop.
+
+    Args:
+        config: `gres.conf` data model to dump.
+        file: gres.conf file to write.
+        mode: Access mode to apply to the gres.conf file. (Default: rw-r--r--)
+        user: User to set as owner of the gres.conf file. (Default: $USER)
+        group: Group to set as owner of the gres.conf file. (Default: None)
+        durability: Durability level of the write. (Default: process-wide durability level)
+        executor: Executor to write the gres.conf file on. (Default: process-wide executor)
+    """
+    await run_in_executor(
+        dump, config, file, mode, user, group, durability=durability, executor=executor
+    )
+
+
+def aedit(
+    file: Union[str, os.PathLike],
+    mode: int = 0o644,
+    user: Optional[Union[str, int]] = None,
+    group: Optional[Union[str, int]] = None,
+    *,
+    timeout: Optional[float] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncEditContext:
+    """Edit a gres.conf file without blocking the event loop.
+
+    See `edit` for details. Use as `async with aedit(...) as config`.
+
     Args:
         file: gres.conf file to edit. An empty config will be created if it does not exist.
         mode: Access mode to apply to the gres.conf file. (Default: rw-r--r--)
         user: User to set as owner of the gres.conf file. (Default: $USER)
         group: Group to set as owner of the gres.conf file. (Default: None)
+        timeout: Seconds to wait for the lock. Wait forever if `None`. (Default: None)
+        executor: Executor to load and write the gres.conf file on.
+            (Default: process-wide executor)
     """
-    if not os.path.exists(file):
-        _logger.warning("file %s not found. creating new empty gres.conf configuration", file)
-        config = GRESConfig()
-    else:
-        config = load(file)
-
-    yield config
-    dump(config, file, mode, user, group)
+    return AsyncEditContext(edit(file, mode, user, group, timeout=timeout), executor)
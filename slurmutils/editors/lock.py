@@ -0,0 +1,152 @@
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Advisory locking of Slurm workload manager configuration files."""
+
+import fcntl
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+_logger = logging.getLogger("slurmutils")
+
+_held_locks = threading.local()
+
+
+def _lock_path(file: Union[str, os.PathLike]) -> Path:
+    """Get path of the sidecar lock file of a configuration file."""
+    target = Path(os.path.realpath(file))
+    return target.parent / f".{target.name}.lock"
+
+
+@contextmanager
+def file_lock(
+    file: Union[str, os.PathLike],
+    *,
+    shared: bool = False,
+    timeout: Optional[float] = None,
+) -> Iterator[None]:
+    """Hold an advisory lock on a configuration file.
+
+    The lock is taken with `flock` on a sidecar lock file next to the configuration file,
+    so it is unaffected by the configuration file being atomically replaced. Locks are
+    reentrant within a thread.
+
+    Args:
+        file: Configuration file to lock.
+        shared: Take a shared lock rather than an exclusive lock. (Default: False)
+        timeout: Seconds to wait for the lock. Wait forever if `None`. (Default: None)
+
+    Raises:
+        TimeoutError: Raised if the lock could not be acquired within `timeout` seconds.
+        RuntimeError: Raised if an exclusive lock is requested while the current thread
+            holds a shared lock on the same file.
+
+    Notes:
+        Shared locks are skipped if the sidecar lock file cannot be opened, e.g. when an
+        unprivileged user loads a configuration file from a read-only directory.
+    """
+    path = _lock_path(file)
+    held = _held_locks.__dict__.setdefault("locks", {})
+    if path in held:
+        if not shared and held[path]:
+            raise RuntimeError(f"cannot upgrade shared lock on {file} to an exclusive lock")
+        yield
+        return
+
+    try:
+        fd = _open_lock_file(path)
+    except OSError as e:
+        if not shared:
+            raise
+        _logger.debug("failed to open lock file %s. skipping lock. reason: %s", path, e)
+        yield
+        return
+
+    try:
+        _flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX, timeout, file)
+        held[path] = shared
+        try:
+            yield
+        finally:
+            del held[path]
+    finally:
+        # Closing the lock file releases the lock.
+        os.close(fd)
+
+
+def _open_lock_file(path: Path) -> int:
+    """Open sidecar lock file, creating it if it does not exist."""
+    try:
+        return os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    except PermissionError:
+        # Read-only access is enough to `flock` an existing lock file.
+        return os.open(path, os.O_RDONLY)
+
+
+def _flock(fd: int, operation: int, timeout: Optional[float], file: Any) -> None:
+    """Apply `flock` operation, polling until `timeout` expires."""
+    if timeout is None:
+        fcntl.flock(fd, operation)
+        return
+
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    while True:
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"timed out waiting for lock on {file}")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.05)
+
+
+async def aflock(file: Union[str, os.PathLike], timeout: Optional[float]) -> int:
+    """Acquire exclusive lock on a configuration file without blocking the event loop.
+
+    Args:
+        file: Configuration file to lock.
+        timeout: Seconds to wait for the lock. Wait forever if `None`.
+
+    Returns:
+        File descriptor of the sidecar lock file. Closing it releases the lock.
+
+    Raises:
+        TimeoutError: Raised if the lock could not be acquired within `timeout` seconds.
+    """
+    import asyncio
+
+    fd = _open_lock_file(_lock_path(file))
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 0.001
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return fd
+            except BlockingIOError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"timed out waiting for lock on {file}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.05)
+    except BaseException:
+        os.close(fd)
+        raise
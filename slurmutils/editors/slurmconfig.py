@@ -14,29 +14,78 @@
 
 """Edit slurm.conf files."""
 
-__all__ = ["dump", "dumps", "load", "loads", "edit"]
+__all__ = ["dump", "dumps", "load", "loads", "edit", "adump", "aload", "aedit"]
 
 import logging
 import os
-from contextlib import contextmanager
-from pathlib import Path
-from typing import Optional, Union
+from concurrent.futures import Executor
+from typing import Any, Iterable, Optional, Union
 
 from ..models import SlurmConfig
-from .editor import dumper, loader, set_file_permissions
+from ..models.model import validation_level
+from .editor import (
+    AsyncEditContext,
+    EditContext,
+    atomic_write,
+    dumper,
+    loader,
+    run_in_executor,
+)
 
 _logger = logging.getLogger("slurmutils")
 
 
 @loader
-def load(file: Union[str, os.PathLike]) -> SlurmConfig:
-    """Load `slurm.conf` data model from slurm.conf file."""
-    return loads(Path(file).read_text())
+def load(
+    file: Union[str, os.PathLike],
+    *,
+    lazy: bool = False,
+    sections: Optional[Iterable[str]] = None,
+    keys: Optional[Iterable[str]] = None,
+    columnar: bool = False,
+    validation: Optional[str] = None,
+) -> SlurmConfig:
+    """Load `slurm.conf` data model from slurm.conf file.
 
+    Args:
+        file: slurm.conf file to load.
+        lazy: Defer parsing node and partition sections until they are first accessed.
+        sections: Only load these sections, e.g. `Partitions`.
+        keys: Only load these global options, e.g. `ClusterName`.
+        columnar: Store nodes in a columnar `NodeTable` to reduce memory usage.
+        validation: Validation level to load with, `strict`, `fast` or `off`.
+            (Default: process-wide validation level)
+    """
+    with validation_level(validation), open(file) as fin:
+        return SlurmConfig.from_lines(
+            fin, lazy=lazy, sections=sections, keys=keys, columnar=columnar
+        )
+
+
+def loads(
+    content: str,
+    *,
+    lazy: bool = False,
+    sections: Optional[Iterable[str]] = None,
+    keys: Optional[Iterable[str]] = None,
+    columnar: bool = False,
+    validation: Optional[str] = None,
+) -> SlurmConfig:
+    """Load `slurm.conf` data model from string.
 
-def loads(content: str) -> SlurmConfig:
-    """Load `slurm.conf` data model from string."""
-    return SlurmConfig.from_str(content)
+    Args:
+        content: slurm.conf content to load.
+        lazy: Defer parsing node and partition sections until they are first accessed.
+        sections: Only load these sections, e.g. `Partitions`.
+        keys: Only load these global options, e.g. `ClusterName`.
+        columnar: Store nodes in a columnar `NodeTable` to reduce memory usage.
+        validation: Validation level to load with, `strict`, `fast` or `off`.
+            (Default: process-wide validation level)
+    """
+    with validation_level(validation):
+        return SlurmConfig.from_str(
+            content, lazy=lazy, sections=sections, keys=keys, columnar=columnar
+        )
 
 
 @dumper
@@ -46,10 +95,23 @@ def dump(
     mode: int = 0o644,
     user: Optional[Union[str, int]] = None,
     group: Optional[Union[str, int]] = None,
+    *,
+    durability: Optional[str] = None,
 ) -> None:
-    """Dump `slurm.conf` data model into slurm.conf file."""
-    Path(file).write_text(dumps(config))
-    set_file_permissions(file, mode, user, group)
+    """Dump `slurm.conf` data model into slurm.conf file.
+
+    The file is replaced atomically, so readers never observe a partially written
+    slurm.conf file or one with the wrong permissions.
+
+    Args:
+        config: `slurm.conf` data model to dump.
+        file: slurm.conf file to write.
+        mode: Access mode to apply to the slurm.conf file. (Default: rw-r--r--)
+        user: User to set as owner of the slurm.conf file. (Default: $USER)
+        group: Group to set as owner of the slurm.conf file. (Default: None)
+        durability: Durability level of the write. (Default: process-wide durability level)
+    """
+    atomic_write(file, config.iter_lines(), mode, user, group, durability=durability)
 
 
 def dumps(config: SlurmConfig) -> str:
@@ -57,26 +119,90 @@ def dumps(config: SlurmConfig) -> str:
     return str(config)
 
 
-@contextmanager
 def edit(
     file: Union[str, os.PathLike],
     mode: int = 0o644,
     user: Optional[Union[str, int]] = None,
     group: Optional[Union[str, int]] = None,
-) -> SlurmConfig:
+    *,
+    timeout: Optional[float] = None,
+) -> EditContext:
     """Edit a slurm.conf file.
 
+    An exclusive lock on the slurm.conf file is held for the whole edit, so concurrent
+    edits do not overwrite each other. The slurm.conf file is only rewritten if the data
+    model was changed. The `written` attribute of the returned context manager reports
+    whether a write happened.
+
+    Args:
+        file: slurm.conf file to edit. An empty config will be created if it does not exist.
+        mode: Access mode to apply to the slurm.conf file. (Default: rw-r--r--)
+        user: User to set as owner of the slurm.conf file. (Default: $USER)
+        group: Group to set as owner of the slurm.conf file. (Default: None)
+        timeout: Seconds to wait for the lock. Wait forever if `None`. (Default: None)
+    """
+    return EditContext(file, SlurmConfig, mode, user, group, timeout=timeout)
+
+
+async def aload(
+    file: Union[str, os.PathLike], *, executor: Optional[Executor] = None, **kwargs: Any
+) -> SlurmConfig:
+    """Load `slurm.conf` data model from slurm.conf file without blocking the event loop.
+
+    Args:
+        file: slurm.conf file to load.
+        executor: Executor to load the slurm.conf file on. (Default: process-wide executor)
+        **kwargs: Keyword arguments to pass to `load`.
+    """
+    return await run_in_executor(load, file, executor=executor, **kwargs)
+
+
+async def adump(
+    config: SlurmConfig,
+    file: Union[str, os.PathLike],
+    mode: int = 0o644,
+    user: Optional[Union[str, int]] = None,
+    group: Optional[Union[str, int]] = None,
+    *,
+    durability: Optional[str] = None,
+    executor: Optional[Executor] = None,
+) -> None:
+    """Dump `slurm.conf` data model into slurm.conf file without blocking the event loop.
+
+    Args:
+        config: `slurm.conf` data model to dump.
+        file: slurm.conf file to write.
+        mode: Access mode to apply to the slurm.conf file. (Default: rw-r--r--)
+        user: User to set as owner of the slurm.conf file. (Default: $USER)
+        group: Group to set as owner of the slurm.conf file. (Default: None)
+        durability: Durability level of the write. (Default: process-wide durability level)
+        executor: Executor to write the slurm.conf file on. (Default: process-wide executor)
+    """
+    await run_in_executor(
+        dump, config, file, mode, user, group, durability=durability, executor=executor
+    )
+
+
+def aedit(
+    file: Union[str, os.PathLike],
+    mode: int = 0o644,
+    user: Optional[Union[str, int]] = None,
+    group: Optional[Union[str, int]] = None,
+    *,
+    timeout: Optional[float] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncEditContext:
+    """Edit a slurm.conf file without blocking the event loop.
+
+    See `edit` for details. Use as `async with aedit(...) as config`.
+
     Args:
         file: slurm.conf file to edit. An empty config will be created if it does not exist.
         mode: Access mode to apply to the slurm.conf file. (Default: rw-r--r--)
         user: User to set as owner of the slurm.conf file. (Default: $USER)
         group: Group to set as owner of the slurm.conf file. (Default: None)
+        timeout: Seconds to wait for the lock. Wait forever if `None`. (Default: None)
+        executor: Executor to load and write the slurm.conf file on.
+            (Default: process-wide executor)
     """
-    if not os.path.exists(file):
-        _logger.warning("file %s not found. creating new empty slurm.conf configuration", file)
-        config = SlurmConfig()
-    else:
-        config = load(file)
-
-    yield config
-    dump(config, file, mode, user, group)
+    return AsyncEditContext(edit(file, mode, user, group, timeout=timeout), executor)
@@ -14,17 +14,58 @@
 
 """Data models for common Slurm objects."""
 
-from .acctgather import AcctGatherConfig as AcctGatherConfig
-from .cgroup import CgroupConfig as CgroupConfig
-from .gres import GRESConfig as GRESConfig
-from .gres import GRESName as GRESName
-from .gres import GRESNameMapping as GRESNameMapping
-from .gres import GRESNode as GRESNode
-from .gres import GRESNodeMapping as GRESNodeMapping
-from .slurm import DownNodes as DownNodes
-from .slurm import FrontendNode as FrontendNode
-from .slurm import Node as Node
-from .slurm import NodeSet as NodeSet
-from .slurm import Partition as Partition
-from .slurm import SlurmConfig as SlurmConfig
-from .slurmdbd import SlurmdbdConfig as SlurmdbdConfig
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .acctgather import AcctGatherConfig as AcctGatherConfig
+    from .cgroup import CgroupConfig as CgroupConfig
+    from .gres import GRESConfig as GRESConfig
+    from .gres import GRESName as GRESName
+    from .gres import GRESNameMapping as GRESNameMapping
+    from .gres import GRESNode as GRESNode
+    from .gres import GRESNodeMapping as GRESNodeMapping
+    from .slurm import DownNodes as DownNodes
+    from .slurm import FrontendNode as FrontendNode
+    from .slurm import Node as Node
+    from .slurm import NodeSet as NodeSet
+    from .slurm import Partition as Partition
+    from .slurm import SlurmConfig as SlurmConfig
+    from .slurmdbd import SlurmdbdConfig as SlurmdbdConfig
+    from .table import NodeTable as NodeTable
+
+# Data models are imported from their modules on first access so that using one
+# data model does not pay for importing all the others.
+_exports = {
+    "AcctGatherConfig": ".acctgather",
+    "CgroupConfig": ".cgroup",
+    "GRESConfig": ".gres",
+    "GRESName": ".gres",
+    "GRESNameMapping": ".gres",
+    "GRESNode": ".gres",
+    "GRESNodeMapping": ".gres",
+    "DownNodes": ".slurm",
+    "FrontendNode": ".slurm",
+    "Node": ".slurm",
+    "NodeSet": ".slurm",
+    "Partition": ".slurm",
+    "SlurmConfig": ".slurm",
+    "SlurmdbdConfig": ".slurmdbd",
+    "NodeTable": ".table",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str) -> Any:
+    """Import data model `name` on first access."""
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = globals()[name] = getattr(importlib.import_module(_exports[name], __name__), name)
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including data models that have not been imported yet."""
+    return sorted({*globals(), *_exports})
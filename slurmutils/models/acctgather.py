@@ -14,19 +14,40 @@
 
 """Data models for `acct_gather.conf` configuration file."""
 
-from .model import BaseModel, clean, format_key, generate_descriptors, marshall_content, parse_line
+from typing import Iterable, Iterator, Optional
+
+from .model import (
+    BaseModel,
+    Option,
+    clean,
+    format_key,
+    marshall_content,
+    mentions_key,
+    parse_line,
+)
 from .option import AcctGatherConfigOptionSet
 
 
 class AcctGatherConfig(BaseModel):
     """`acct_gather.conf` data model."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:
         super().__init__(AcctGatherConfigOptionSet, **kwargs)
 
     @classmethod
-    def from_str(cls, content: str) -> "AcctGatherConfig":
-        """Construct AcctGatherConfig data model from acct_gather.conf format."""
+    def from_str(cls, content: str, *, keys: Optional[Iterable[str]] = None) -> "AcctGatherConfig":
+        """Construct AcctGatherConfig data model from acct_gather.conf format.
+
+        Args:
+            content: acct_gather.conf content.
+            keys: Only load these configuration options. Lines that set none of them
+                are skipped before they are parsed.
+        """
+        if keys is not None:
+            keys = frozenset(keys)
+
         data = {}
         lines = content.splitlines()
         for index, line in enumerate(lines):
@@ -34,16 +55,22 @@ class AcctGatherConfig(BaseModel):
             if config is None:
                 continue
 
-            data.update(parse_line(AcctGatherConfigOptionSet, config))
+            if keys is None:
+                data.update(parse_line(AcctGatherConfigOptionSet, config))
+            elif mentions_key(config, keys):
+                options = parse_line(AcctGatherConfigOptionSet, config)
+                data.update({k: v for k, v in options.items() if k in keys})
 
         return AcctGatherConfig.from_dict(data)
 
     def __str__(self) -> str:
         """Return AcctGatherConfig data model in acct_gather.conf format."""
-        result = []
-        result.extend(marshall_content(AcctGatherConfigOptionSet, self.dict()))
-        return "\n".join(result)
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield AcctGatherConfig data model as acct_gather.conf configuration lines."""
+        yield from marshall_content(AcctGatherConfigOptionSet, self.data)
 
 
 for opt in AcctGatherConfigOptionSet.keys():
-    setattr(AcctGatherConfig, format_key(opt), property(*generate_descriptors(opt)))
+    setattr(AcctGatherConfig, format_key(opt), Option(opt))
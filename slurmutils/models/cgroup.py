@@ -14,19 +14,40 @@
 
 """Data models for `cgroup.conf` configuration file."""
 
-from .model import BaseModel, clean, format_key, generate_descriptors, marshall_content, parse_line
+from typing import Iterable, Iterator, Optional
+
+from .model import (
+    BaseModel,
+    Option,
+    clean,
+    format_key,
+    marshall_content,
+    mentions_key,
+    parse_line,
+)
 from .option import CgroupConfigOptionSet
 
 
 class CgroupConfig(BaseModel):
     """`cgroup.conf` data model."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:
         super().__init__(CgroupConfigOptionSet, **kwargs)
 
     @classmethod
-    def from_str(cls, content: str) -> "CgroupConfig":
-        """Construct CgroupConfig data model from cgroup.conf format."""
+    def from_str(cls, content: str, *, keys: Optional[Iterable[str]] = None) -> "CgroupConfig":
+        """Construct CgroupConfig data model from cgroup.conf format.
+
+        Args:
+            content: cgroup.conf content.
+            keys: Only load these configuration options. Lines that set none of them
+                are skipped before they are parsed.
+        """
+        if keys is not None:
+            keys = frozenset(keys)
+
         data = {}
         lines = content.splitlines()
         for index, line in enumerate(lines):
@@ -34,16 +55,22 @@ class CgroupConfig(BaseModel):
             if config is None:
                 continue
 
-            data.update(parse_line(CgroupConfigOptionSet, config))
+            if keys is None:
+                data.update(parse_line(CgroupConfigOptionSet, config))
+            elif mentions_key(config, keys):
+                options = parse_line(CgroupConfigOptionSet, config)
+                data.update({k: v for k, v in options.items() if k in keys})
 
         return CgroupConfig.from_dict(data)
 
     def __str__(self) -> str:
         """Return CgroupConfig data model in cgroup.conf format."""
-        result = []
-        result.extend(marshall_content(CgroupConfigOptionSet, self.dict()))
-        return "\n".join(result)
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield CgroupConfig data model as cgroup.conf configuration lines."""
+        yield from marshall_content(CgroupConfigOptionSet, self.data)
 
 
 for opt in CgroupConfigOptionSet.keys():
-    setattr(CgroupConfig, format_key(opt), property(*generate_descriptors(opt)))
+    setattr(CgroupConfig, format_key(opt), Option(opt))
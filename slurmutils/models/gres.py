@@ -17,55 +17,33 @@
 __all__ = ["GRESConfig", "GRESName", "GRESNode", "GRESNodeMapping", "GRESNameMapping"]
 
 from abc import ABC
-from collections.abc import MutableMapping, Sequence
+from collections.abc import Iterable, Iterator, MutableMapping, Sequence
 from itertools import chain
 from typing import Any
 
-from jsonschema import ValidationError, validate
-
-from .model import BaseMapping, BaseModel, clean, marshall_content, parse_line
-from .option import GRESConfigOptionSet, GRESNameOptionSet, GRESNodeOptionSet
-from .schema import (
-    GRES_NAME_MAPPING_SCHEMA,
-    GRES_NAME_SCHEMA,
-    GRES_NODE_MAPPING_SCHEMA,
-    GRES_NODE_SCHEMA,
+# The mappings are validated against JSON schemas, so jsonschema is imported with them
+# rather than on first validation. jsonschema reads its meta-schemas from disk when it
+# is imported, which fails if a fake filesystem, e.g. pyfakefs, is active by then.
+import jsonschema  # noqa F401
+
+from .model import (
+    BaseMapping,
+    BaseModel,
+    clean,
+    leading_key,
+    marshall_content,
+    mentions_key,
+    parse_line,
 )
-
-
-def _gres_name_decoder(o: Any) -> Any:
-    """Decode `gres.conf` data model within JSON object.
-
-    Args:
-        o: JSON object to decode.
-    """
-    try:
-        validate(o, schema=GRES_NAME_SCHEMA)
-        return GRESName.from_dict(o)
-    except ValidationError:
-        pass
-
-    return o
-
-
-def _gres_node_decoder(o: Any) -> Any:
-    """Decode `gres.conf` node data model within a JSON object.
-
-    Args:
-        o: JSON object in to decode.
-    """
-    try:
-        validate(o, schema=GRES_NODE_SCHEMA)
-        return GRESNode.from_dict(o)
-    except ValidationError:
-        pass
-
-    return o
+from .option import GRESConfigOptionSet, GRESNameOptionSet, GRESNodeOptionSet
+from .schema import GRES_NAME_MAPPING_SCHEMA, GRES_NODE_MAPPING_SCHEMA
 
 
 class GRESName(BaseModel):
     """`gres.conf` name data model."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:  # noqa N803
         super().__init__(GRESNameOptionSet, **kwargs)
 
@@ -229,6 +207,8 @@ class GRESName(BaseModel):
 class GRESNode(GRESName):
     """`gres.conf` node data model."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):  # noqa N803
         # Want to share `GRESName` descriptors, but not constructor.
         BaseModel.__init__(self, GRESNodeOptionSet, **kwargs)
@@ -266,17 +246,26 @@ class GRESNode(GRESName):
 class _GRESBaseMapping(BaseMapping, ABC):
     """Base `gres.conf` data model mapping."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return `gres.conf` data model mapping as gres.conf configuration block."""
-        return "\n".join(str(gres) for gres in chain.from_iterable(self.values()))
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield `gres.conf` data model mapping as gres.conf configuration lines."""
+        for gres in chain.from_iterable(self.values()):
+            yield str(gres)
 
 
 class GRESNameMapping(_GRESBaseMapping):
     """Map of generic resource names to `gres.conf` name data models."""
 
+    __slots__ = ()
+
     @property
-    def _decoder(self) -> Any:
-        return _gres_name_decoder
+    def _model(self) -> type[GRESName]:
+        return GRESName
 
     @property
     def _schema(self) -> dict[str, Any]:
@@ -286,9 +275,11 @@ class GRESNameMapping(_GRESBaseMapping):
 class GRESNodeMapping(_GRESBaseMapping):
     """Map of node names to list of `gres.conf` node data models."""
 
+    __slots__ = ()
+
     @property
-    def _decoder(self) -> Any:
-        return _gres_node_decoder
+    def _model(self) -> type[GRESNode]:
+        return GRESNode
 
     @property
     def _schema(self) -> dict[str, Any]:
@@ -298,6 +289,8 @@ class GRESNodeMapping(_GRESBaseMapping):
 class GRESConfig(BaseModel):
     """`gres.conf` data model."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -310,35 +303,65 @@ class GRESConfig(BaseModel):
         self.data["Nodes"] = GRESNodeMapping(Nodes)
 
     @classmethod
-    def from_str(cls, content: str) -> "GRESConfig":
-        """Construct `gres.conf` data model from a gres.conf configuration file."""
-        config = {"Names": GRESNameMapping(), "Nodes": GRESNodeMapping()}
+    def from_str(
+        cls,
+        content: str,
+        *,
+        sections: Iterable[str] | None = None,
+        keys: Iterable[str] | None = None,
+    ) -> "GRESConfig":
+        """Construct `gres.conf` data model from a gres.conf configuration file.
+
+        Args:
+            content: gres.conf content.
+            sections: Only load these sections, `Names` and/or `Nodes`.
+            keys: Only load these global options, e.g. `AutoDetect`.
+
+        Notes:
+            If either `sections` or `keys` is set, only the requested parts of gres.conf
+            are loaded. Lines of other sections, and global lines that set none of `keys`,
+            are skipped before they are parsed.
+        """
+        if sections is not None or keys is not None:
+            sections = frozenset(sections or ())
+            keys = frozenset(keys or ())
+
+        # Entries are collected as dictionaries so that the mappings are validated and
+        # their data models are built once, by `GRESConfig`.
+        config = {"Names": {}, "Nodes": {}}
         for line in [clean(line) for line in content.splitlines()]:
             if line is None:
                 continue
 
-            if line.startswith("Name"):
-                new = GRESName.from_str(line)
-                config["Names"][new.name] = config["Names"].get(new.name, []) + [new]
-            elif line.startswith("NodeName"):
-                new = GRESNode.from_str(line)
-                config["Nodes"][new.node_name] = config["Nodes"].get(new.node_name, []) + [new]
-            else:
+            key = leading_key(line)
+            if key == "Name":
+                if sections is not None and "Names" not in sections:
+                    continue
+                new = parse_line(GRESNameOptionSet, line)
+                config["Names"].setdefault(new.get("Name"), []).append(new)
+            elif key == "NodeName":
+                if sections is not None and "Nodes" not in sections:
+                    continue
+                new = parse_line(GRESNodeOptionSet, line)
+                config["Nodes"].setdefault(new.get("NodeName"), []).append(new)
+            elif keys is None:
                 config.update(parse_line(GRESConfigOptionSet, line))
+            elif mentions_key(line, keys):
+                options = parse_line(GRESConfigOptionSet, line)
+                config.update({k: v for k, v in options.items() if k in keys})
 
         return GRESConfig(**config)
 
     def __str__(self) -> str:
         """Return `gres.conf` data model in gres.conf configuration format."""
-        out = []
-        if self.auto_detect:
-            out.append(f"AutoDetect={self.auto_detect}")
-        if self.names:
-            out.append(str(self.names))
-        if self.nodes:
-            out.append(str(self.nodes))
+        return "\n".join(self.iter_lines()) + "\n"
 
-        return "\n".join(out) + "\n"
+    def iter_lines(self) -> Iterator[str]:
+        """Yield `gres.conf` data model as gres.conf configuration lines."""
+        if self.auto_detect:
+            yield f"AutoDetect={self.auto_detect}"
+        yield from self.names.iter_lines()
+        yield from self.nodes.iter_lines()
 
     @property
     def auto_detect(self) -> str | None:
@@ -17,29 +17,82 @@
 __all__ = [
     "BaseMapping",
     "BaseModel",
+    "InternTable",
+    "Option",
+    "VALIDATION_LEVELS",
     "clean",
+    "copy_data",
     "format_key",
     "generate_descriptors",
+    "get_intern_table",
+    "get_validation_level",
+    "interning",
+    "leading_key",
     "marshall_content",
+    "mentions_key",
     "parse_line",
+    "set_intern_table",
+    "set_validation_level",
+    "tokenize",
+    "validation_level",
 ]
 
 import copy
 import json
 import re
-import shlex
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, MutableMapping
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
 
-from jsonschema import ValidationError, validate
 from typing_extensions import Self
 
 from ..exceptions import ModelError
+from .schema import validate
 
 _acronym = re.compile(r"(?<=[A-Z])(?=[A-Z][a-z])")
 _camelize = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
 
+# Characters that require the slow path of the configuration line lexer.
+_special = re.compile(r"[\"'\\#]")
+# A `#` is the start of a comment unless it is escaped with a backslash.
+_comment = re.compile(r"(?<!\\)(?:\\\\)*#")
+# A word is a run of unquoted characters, quoted strings, and escaped characters.
+# Any other non-whitespace character is an unbalanced quote or a dangling escape.
+_token = re.compile(r"""(?:[^\s"'\\]+|"(?:[^"\\]|\\.)*"|'[^']*'|\\.)+|(\S)""", re.DOTALL)
+_unquote = re.compile(r""""((?:[^"\\]|\\.)*)"|'([^']*)'|\\(.)""", re.DOTALL)
+# Like Slurm, `\#` is a literal `#` inside double quotes as well.
+_escape = re.compile(r'\\(["\\#])')
+_leading_key = re.compile(r"\s*([^\s=]*)")
+
+
+# Immutable values that can be shared between a data model and its copies.
+_immutable = frozenset({str, int, float, bool, type(None)})
+
+
+def copy_data(value: Any) -> Any:
+    """Copy data model content.
+
+    Dictionaries and lists are copied, while immutable values such as strings are
+    shared with the copy rather than duplicated. This is considerably faster than
+    `copy.deepcopy` for the nested dictionaries and lists that data models store.
+
+    Args:
+        value: Data model content to copy.
+    """
+    cls = type(value)
+    if cls is dict:
+        return {k: v if type(v) in _immutable else copy_data(v) for k, v in value.items()}
+    if cls is list:
+        return [v if type(v) in _immutable else copy_data(v) for v in value]
+    if cls in _immutable:
+        return value
+    if cls is tuple and all(type(v) in _immutable for v in value):
+        return value
+
+    return copy.deepcopy(value)
+
 
 def format_key(key: str) -> str:
     """Format Slurm configuration keys from SlurmCASe to camelCase.
@@ -107,23 +160,120 @@ def expand(d: MutableMapping[str, Any]) -> dict[str, Any]:
     return _expand_dict(d)
 
 
+class Option:
+    """Data descriptor for retrieving and mutating a configuration option.
+
+    Args:
+        opt: Configuration option to access, e.g. `SlurmctldPort`.
+
+    Notes:
+        A single descriptor is shared by every instance of a data model. The option is
+        read from and written to the `data` dictionary of the instance, and options that
+        are not set are read as `None`.
+    """
+
+    __slots__ = ("opt",)
+
+    def __init__(self, opt: str) -> None:
+        self.opt = opt
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:  # noqa D105
+        if instance is None:
+            return self
+
+        return instance.data.get(self.opt)
+
+    def __set__(self, instance: Any, value: Any) -> None:  # noqa D105
+        instance.data[self.opt] = value
+
+    def __delete__(self, instance: Any) -> None:  # noqa D105
+        del instance.data[self.opt]
+
+    def __repr__(self) -> str:  # noqa D105
+        return f"{type(self).__name__}({self.opt!r})"
+
+
 def generate_descriptors(opt: str) -> tuple[Callable, Callable, Callable]:
     """Generate descriptors for retrieving and mutating configuration options.
 
     Args:
         opt: Configuration option to generate descriptors for.
+
+    Notes:
+        Kept for compatibility. Data models use `Option` directly.
+    """
+    descriptor = Option(opt)
+    return descriptor.__get__, descriptor.__set__, descriptor.__delete__
+
+
+def _strip_comment(line: str) -> str:
+    """Remove the inline comment from a configuration line.
+
+    Notes:
+        Like Slurm, any `#` that is not escaped with a backslash starts a comment,
+        even if it is within a quoted string.
+    """
+    if "#" not in line:
+        return line
+
+    return line[: m.end() - 1] if (m := _comment.search(line)) else line
+
+
+def _unquote_word(m: re.Match) -> str:
+    """Return the literal text of a quoted string or escaped character."""
+    double, single, escaped = m.groups()
+    if double is not None:
+        return _escape.sub(r"\1", double) if "\\" in double else double
+    if single is not None:
+        return single
+
+    return escaped
+
+
+def tokenize(line: str) -> list[str]:
+    """Split configuration line into words.
+
+    Args:
+        line: Configuration line to split.
+
+    Notes:
+        Words are separated by whitespace. Quoted strings and backslash escapes
+        follow POSIX shell rules, so `Reason="Maintenance Mode"` is a single word.
+        Lines without quotes, escapes, or comments take a fast path that uses `str.split`.
     """
+    if not _special.search(line):
+        return line.split()
+
+    words = []
+    for m in _token.finditer(_strip_comment(line)):
+        if m.group(1) is not None:
+            raise ModelError(f"unbalanced quotation or escape in configuration line: {line}")
+
+        word = m.group()
+        words.append(_unquote.sub(_unquote_word, word) if _special.search(word) else word)
 
-    def getter(self):
-        return self.data.get(opt, None)
+    return words
+
+
+def leading_key(line: str) -> str:
+    """Get the key of the first option in a configuration line.
+
+    Notes:
+        The key is read without tokenizing the line, so it is cheap enough to use
+        for routing or skipping lines before they are parsed.
+    """
+    return _leading_key.match(line).group(1)
 
-    def setter(self, value):
-        self.data[opt] = value
 
-    def deleter(self):
-        del self.data[opt]
+def mentions_key(line: str, keys: Iterable[str]) -> bool:
+    """Check if a configuration line may set any of `keys`.
 
-    return getter, setter, deleter
+    Notes:
+        A line can set several options, so every key is searched for, not only the
+        leading key. The check is a plain substring search, so it can match lines
+        that do not set a key. Callers must still filter the options of matched lines.
+    """
+    return any(key in line for key in keys)
 
 
 def clean(line: str) -> str | None:
@@ -132,7 +282,191 @@ def clean(line: str) -> str | None:
     Returns:
         Line with inline comments removed. `None` if line is a comment.
     """
-    return cleaned if (cleaned := line.split("#", maxsplit=1)[0]) != "" else None
+    return cleaned if (cleaned := _strip_comment(line)) != "" else None
+
+
+class InternTable:
+    """Bounded table of parsed configuration values shared between data models.
+
+    Parsed values are cached by option, parser and raw value, so every occurrence of a
+    repeated value, e.g. `State=UNKNOWN`, shares one object and is only parsed once.
+    Options with the same name are parsed differently by some option sets, e.g.
+    `PreemptMode` in `SlurmConfigOptionSet` and `PartitionOptionSet`, so values are
+    only shared between options with the same parser.
+
+    Args:
+        max_size: Maximum number of values in the table. Once the table is full, values
+            already in the table are still shared, but new values are not added.
+
+    Notes:
+        List values are interned as tuples, so data models parsed while a table is active
+        hold tuples rather than lists for options such as `Features`. Assign a new value
+        to change them. Mutable values other than lists, e.g. dictionaries, are not shared.
+    """
+
+    __slots__ = ("max_size", "_options", "_size")
+
+    def __init__(self, max_size: int = 65536) -> None:
+        self.max_size = max_size
+        self._options: dict[tuple[str, Any], tuple[str, dict[str, Any]]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Get number of values in the table."""
+        return self._size
+
+    def clear(self) -> None:
+        """Remove all values from the table."""
+        self._options.clear()
+        self._size = 0
+
+    def parse(self, key: str, raw: str, parser: Callable[[str], Any] | None) -> tuple[str, Any]:
+        """Parse a configuration option, sharing the key and value with earlier options.
+
+        Args:
+            key: Key of the configuration option.
+            raw: Raw value of the configuration option.
+            parser: Callback that parses the raw value, if any.
+
+        Returns:
+            The interned key and value of the configuration option.
+        """
+        if (entry := self._options.get((key, parser))) is None:
+            entry = self._options.setdefault((key, parser), (key, {}))
+
+        key, values = entry
+        if (value := values.get(raw, _missing)) is not _missing:
+            return key, value
+
+        value = parser(raw) if parser else raw
+        if isinstance(value, list):
+            value = tuple(value)
+        elif not isinstance(value, (str, int, float, tuple)):
+            return key, value
+
+        if self._size < self.max_size:
+            values[raw] = value
+            self._size += 1
+
+        return key, value
+
+
+_missing = object()
+_process_intern_table: Optional[InternTable] = None
+_intern_table: ContextVar[Optional[InternTable]] = ContextVar("intern_table", default=None)
+
+
+def set_intern_table(table: Optional[InternTable]) -> None:
+    """Set the process-wide intern table used by `parse_line`.
+
+    Args:
+        table: Intern table to share parsed values through. `None` disables
+            process-wide interning.
+    """
+    global _process_intern_table
+    _process_intern_table = table
+
+
+def get_intern_table() -> Optional[InternTable]:
+    """Get the intern table in effect, if any."""
+    if (table := _intern_table.get()) is None:
+        table = _process_intern_table
+
+    return table
+
+
+@contextmanager
+def interning(table: Optional[InternTable] = None) -> Iterator[InternTable]:
+    """Intern values parsed by `parse_line` within a block.
+
+    Args:
+        table: Intern table to use. A new table is created if `None`.
+
+    Yields:
+        The active intern table.
+
+    Examples:
+        >>> with interning():
+        ...     config = slurmconfig.load("/etc/slurm/slurm.conf")
+    """
+    table = InternTable() if table is None else table
+    token = _intern_table.set(table)
+    try:
+        yield table
+    finally:
+        _intern_table.reset(token)
+
+
+VALIDATION_LEVELS = ("strict", "fast", "off")
+_process_validation_level = "strict"
+_validation_level: ContextVar[Optional[str]] = ContextVar("validation_level", default=None)
+
+
+def set_validation_level(level: str) -> None:
+    """Set the process-wide validation level of data models.
+
+    Args:
+        level: Validation level to apply outside of `validation_level` blocks.
+            * `strict`: check option names of data models and validate data model
+                mappings against their JSON schema.
+            * `fast`: check option names of data models and the structure of data
+                model mappings only. jsonschema is not used.
+            * `off`: skip all checks. Only use for trusted input, such as
+                configuration files written by `slurmutils` itself.
+
+    Raises:
+        ValueError: Raised if `level` is not a valid validation level.
+    """
+    global _process_validation_level
+    _process_validation_level = _check_validation_level(level)
+
+
+def get_validation_level() -> str:
+    """Get the validation level in effect."""
+    return _validation_level.get() or _process_validation_level
+
+
+@contextmanager
+def validation_level(level: Optional[str]) -> Iterator[str]:
+    """Set the validation level of data models within a block.
+
+    Args:
+        level: Validation level to apply. See `set_validation_level` for the levels.
+            `None` keeps the validation level in effect.
+
+    Yields:
+        The active validation level.
+
+    Raises:
+        ValueError: Raised if `level` is not a valid validation level.
+
+    Notes:
+        Sections that are loaded lazily are checked at the validation level in effect
+        when they are first accessed.
+
+    Examples:
+        >>> with validation_level("off"):
+        ...     config = slurmconfig.load("/etc/slurm/slurm.conf")
+    """
+    if level is None:
+        yield get_validation_level()
+        return
+
+    token = _validation_level.set(_check_validation_level(level))
+    try:
+        yield level
+    finally:
+        _validation_level.reset(token)
+
+
+def _check_validation_level(level: str) -> str:
+    """Check that a validation level is valid."""
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(
+            f"invalid validation level {level!r}. valid levels are {list(VALIDATION_LEVELS)}"
+        )
+
+    return level
 
 
 def parse_line(options, line: str) -> dict[str, Any]:
@@ -141,21 +475,31 @@ def parse_line(options, line: str) -> dict[str, Any]:
     Args:
         options: Available options for line.
         line: Configuration line to parse.
+
+    Notes:
+        Parsed values are shared through the intern table activated with `interning`,
+        or through the process-wide table set with `set_intern_table`, if any.
     """
     data = {}
-    opts = shlex.split(line)  # Use `shlex.split(...)` to preserve quotation strings.
-    for opt in opts:
+    callbacks = options.callbacks
+    table = get_intern_table()
+
+    for opt in tokenize(line):
         k, v = opt.split("=", maxsplit=1)
-        if not hasattr(options, k):
+        if (callback := callbacks.get(k)) is None:
             raise ModelError(
                 (
                     f"unable to parse configuration option {k}. "
-                    + f"valid configuration options are {list(options.keys())}"
+                    + f"valid configuration options are {list(callbacks)}"
                 )
             )
 
-        parse = getattr(options, k).parser
-        data[k] = parse(v) if parse else v
+        parse = callback.parser
+        if table is None:
+            data[k] = parse(v) if parse else v
+        else:
+            k, v = table.parse(k, v, parse)
+            data[k] = v
 
     return data
 
@@ -166,19 +510,27 @@ def marshall_content(options, line: MutableMapping[str, Any]) -> list[str]:
     Args:
         options: Available options for line.
         line: Data model to marshall into line.
+
+    Notes:
+        `#` in values is escaped with a backslash so that it is not read as a comment.
     """
     result = []
+    callbacks = options.callbacks
     for k, v in line.items():
-        if not hasattr(options, k):
+        if (callback := callbacks.get(k)) is None:
             raise ModelError(
                 (
                     f"unable to marshall configuration option {k}. "
-                    + f"valid configuration options are {[option.name for option in options]}"
+                    + f"valid configuration options are {list(callbacks)}"
                 )
             )
 
-        marshall = getattr(options, k).marshaller
-        result.append(f"{k}={marshall(v) if marshall else v}")
+        marshall = callback.marshaller
+        value = f"{marshall(v) if marshall else v}"
+        if "#" in value:
+            # An unescaped `#` would start a comment when the line is read back.
+            value = value.replace("#", "\\#")
+        result.append(f"{k}={value}")
 
     return result
 
@@ -186,15 +538,16 @@ def marshall_content(options, line: MutableMapping[str, Any]) -> list[str]:
 class BaseModel(ABC):
     """Base model for Slurm data models."""
 
+    __slots__ = ("data",)
+
     def __init__(self, validator=None, /, **kwargs) -> None:
-        for k, v in kwargs.items():
-            if not hasattr(validator, k):
-                raise ModelError(
-                    (
-                        f"unrecognized argument {k}. "
-                        + f"valid arguments are {list(validator.keys())}"
+        if get_validation_level() != "off":
+            callbacks = validator.callbacks
+            for k in kwargs:
+                if k not in callbacks:
+                    raise ModelError(
+                        (f"unrecognized argument {k}. " + f"valid arguments are {list(callbacks)}")
                     )
-                )
 
         self.data = kwargs
 
@@ -226,9 +579,13 @@ class BaseModel(ABC):
     def __str__(self) -> str:
         """Return model as configuration string."""
 
+    def iter_lines(self) -> Iterator[str]:
+        """Yield model as configuration lines."""
+        yield str(self)
+
     def dict(self) -> dict[str, Any]:
         """Return model as dictionary."""
-        return copy.deepcopy(self.data)
+        return copy_data(self.data)
 
     def json(self) -> str:
         """Return model as json object."""
@@ -242,17 +599,30 @@ class BaseModel(ABC):
 class BaseMapping(MutableMapping[str, Any], ABC):
     """Base map for Slurm data model mappings."""
 
+    __slots__ = ("_data",)
+
     def __init__(self, d: MutableMapping[str, Any] | None = None) -> None:
         if not d:
             self._data = {}
             return
 
-        try:
-            d = expand(d)
-            validate(d, schema=self._schema)
-            self._data = json.loads(json.dumps(d), object_hook=self._decoder)
-        except ValidationError as e:
-            raise ModelError(e.message)
+        d = expand(d)
+        if (level := get_validation_level()) == "strict":
+            from jsonschema import ValidationError
+
+            try:
+                validate(d, schema=self._schema)
+            except ValidationError as e:
+                raise ModelError(e.message)
+        elif level == "fast":
+            self._check_structure(d)
+
+        # `expand` returns a new mapping, so entries are replaced with data models in place.
+        model = self._model
+        for entries in d.values():
+            entries[:] = [model.from_dict(entry) for entry in entries]
+
+        self._data = d
 
     @property
     @abstractmethod
@@ -261,8 +631,22 @@ class BaseMapping(MutableMapping[str, Any], ABC):
 
     @property
     @abstractmethod
-    def _decoder(self) -> Any:
-        """Get data model decoder."""
+    def _model(self) -> type[BaseModel]:
+        """Get data model of the entries in the mapping."""
+
+    def _check_structure(self, d: dict[str, Any]) -> None:
+        """Check that a mapping maps names to lists of data model entries.
+
+        Raises:
+            ModelError: Raised if the mapping is malformed.
+        """
+        for k, entries in d.items():
+            if (
+                not isinstance(k, str)
+                or not isinstance(entries, list)
+                or not all(isinstance(entry, dict) for entry in entries)
+            ):
+                raise ModelError(f"{k!r} must map to a list of {self._model.__name__} data models")
 
     @classmethod
     def from_dict(cls, d: MutableMapping[str, Any]) -> Self:
@@ -30,7 +30,8 @@ __all__ = [
 ]
 
 from dataclasses import dataclass, fields
-from typing import Iterable
+from types import MappingProxyType
+from typing import ClassVar, Iterable, Mapping
 
 from .callback import (
     Callback,
@@ -42,9 +43,20 @@ from .callback import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class _OptionSet:
-    """Base for configuration option dataclasses."""
+    """Base for configuration option dataclasses.
+
+    Notes:
+        `callbacks` is a read-only map of configuration option names to their
+        parsing and marshalling callbacks. It is built once when this module is
+        imported so that parsers do not need to walk the dataclass fields.
+
+        Option sets are never instantiated, so `__init__`, `__repr__` and `__eq__`
+        are not generated. Generating them for hundreds of fields is slow to import.
+    """
+
+    callbacks: ClassVar[Mapping[str, Callback]] = MappingProxyType({})
 
     @classmethod
     def keys(cls) -> Iterable[str]:
@@ -53,7 +65,7 @@ class _OptionSet:
             yield field.name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class AcctGatherConfigOptionSet(_OptionSet):
     """`acct_gather.conf` configuration options."""
 
@@ -77,7 +89,7 @@ class AcctGatherConfigOptionSet(_OptionSet):
     SysfsInterfaces: Callback = CommaSeparatorCallback
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class CgroupConfigOptionSet(_OptionSet):
     """`cgroup.conf` configuration options."""
 
@@ -100,14 +112,14 @@ class CgroupConfigOptionSet(_OptionSet):
     SignalChildrenProcesses: Callback = Callback()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class GRESConfigOptionSet(_OptionSet):
     """`gres.conf` configuration options."""
 
     AutoDetect: Callback = Callback()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class GRESNameOptionSet(GRESConfigOptionSet):
     """`gres.conf` generic configuration options."""
 
@@ -121,14 +133,14 @@ class GRESNameOptionSet(GRESConfigOptionSet):
     Type: Callback = Callback()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class GRESNodeOptionSet(GRESNameOptionSet):
     """`gres.conf` node configuration options."""
 
     NodeName: Callback = Callback()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class SlurmdbdConfigOptionSet(_OptionSet):
     """`slurmdbd.conf` configuration options."""
 
@@ -186,7 +198,7 @@ class SlurmdbdConfigOptionSet(_OptionSet):
     TrackWCKey: Callback = Callback()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class SlurmConfigOptionSet(_OptionSet):
     """`slurm.conf` configuration options."""
 
@@ -253,6 +265,7 @@ class SlurmConfigOptionSet(_OptionSet):
     HealthCheckNodeState: Callback = CommaSeparatorCallback
     HealthCheckProgram: Callback = Callback()
     InactiveLimit: Callback = Callback()
+    Include: Callback = Callback()
     InteractiveStepOptions: Callback = Callback()
     JobAcctGatherType: Callback = Callback()
     JobAcctGatherFrequency: Callback = SlurmDictCallback
@@ -419,7 +432,7 @@ class SlurmConfigOptionSet(_OptionSet):
     X11Parameters: Callback = Callback()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class NodeOptionSet(_OptionSet):
     """`slurm.conf` node configuration options."""
 
@@ -448,7 +461,7 @@ class NodeOptionSet(_OptionSet):
     Weight: Callback = Callback()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class DownNodeOptionSet(_OptionSet):
     """`slurm.conf` down node configuration options."""
 
@@ -457,7 +470,7 @@ class DownNodeOptionSet(_OptionSet):
     State: Callback = Callback()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class FrontendNodeOptionSet(_OptionSet):
     """`slurm.conf` frontend node configuration options."""
 
@@ -472,7 +485,7 @@ class FrontendNodeOptionSet(_OptionSet):
     State: Callback = Callback()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class NodeSetOptionSet(_OptionSet):
     """`slurm.conf` node set configuration options."""
 
@@ -481,7 +494,7 @@ class NodeSetOptionSet(_OptionSet):
     Nodes: Callback = CommaSeparatorCallback
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False, eq=False)
 class PartitionOptionSet(_OptionSet):
     """`slurm.conf` partition configuration options."""
 
@@ -528,3 +541,22 @@ class PartitionOptionSet(_OptionSet):
     SuspendTime: Callback = Callback()
     SuspendTimeout: Callback = Callback()
     TRESBillingWeights: Callback = SlurmDictCallback
+
+
+for _option_set in (
+    AcctGatherConfigOptionSet,
+    CgroupConfigOptionSet,
+    GRESConfigOptionSet,
+    GRESNameOptionSet,
+    GRESNodeOptionSet,
+    SlurmdbdConfigOptionSet,
+    SlurmConfigOptionSet,
+    NodeOptionSet,
+    DownNodeOptionSet,
+    FrontendNodeOptionSet,
+    NodeSetOptionSet,
+    PartitionOptionSet,
+):
+    _option_set.callbacks = MappingProxyType(
+        {field.name: field.default for field in fields(_option_set)}
+    )
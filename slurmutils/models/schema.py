@@ -19,8 +19,13 @@ __all__ = [
     "GRES_NODE_SCHEMA",
     "GRES_NAME_MAPPING_SCHEMA",
     "GRES_NODE_MAPPING_SCHEMA",
+    "validate",
+    "validator",
 ]
 
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Any
+
 _GLOBAL_SCHEMA_VERSION = "https://json-schema.org/draft/2020-12/schema"
 
 # `gres.conf` data model schemas.
@@ -95,3 +100,95 @@ GRES_CONFIG_SCHEMA = {
         "GRESNodeMapping": GRES_NODE_MAPPING_SCHEMA,
     },
 }
+
+# Validators are keyed by schema identity since schemas are unhashable dicts.
+_validators: dict[int, tuple[dict[str, Any], Any]] = {}
+_validator_class: Any = None
+
+
+def _freeze(value: Any) -> Hashable:
+    """Get hashable key of a JSON value that is equal for equal JSON values.
+
+    Raises:
+        TypeError: Raised if the value contains unhashable objects that are not JSON values.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        # JSON booleans are not equal to the numbers 0 and 1.
+        return bool, value
+    if isinstance(value, Mapping):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, Sequence):
+        return tuple(_freeze(v) for v in value)
+
+    hash(value)
+    return value
+
+
+def _unique_items(validator: Any, unique: bool, instance: Any, schema: dict[str, Any]) -> Any:
+    """Check `uniqueItems` keyword by hashing items.
+
+    Notes:
+        jsonschema compares every pair of items when they cannot be sorted, e.g.
+        objects, so checking a list of 10k `gres.conf` names takes minutes.
+    """
+    if not unique or not validator.is_type(instance, "array"):
+        return
+
+    try:
+        keys = {_freeze(item) for item in instance}
+    except TypeError:
+        from jsonschema import Draft202012Validator
+
+        unique_items = Draft202012Validator.VALIDATORS["uniqueItems"]
+        yield from unique_items(validator, unique, instance, schema)
+        return
+
+    if len(keys) != len(instance):
+        from jsonschema import ValidationError
+
+        yield ValidationError(f"{instance!r} has non-unique elements")
+
+
+def validator(schema: dict[str, Any]) -> Any:
+    """Get a precompiled `Draft202012Validator` for a data model schema.
+
+    Args:
+        schema: JSON schema to get validator for.
+
+    Notes:
+        The schema itself is checked and its validator is built on first use only.
+        `jsonschema.validate` does both on every call.
+    """
+    global _validator_class
+    if (entry := _validators.get(id(schema))) is not None and entry[0] is schema:
+        return entry[1]
+
+    # jsonschema is slow to import, so it is imported by the `gres` data models that use
+    # these schemas rather than by every data model.
+    from jsonschema import Draft202012Validator, validators
+
+    if _validator_class is None:
+        _validator_class = validators.extend(Draft202012Validator, {"uniqueItems": _unique_items})
+
+    _validator_class.check_schema(schema)
+    _validators[id(schema)] = (schema, _validator_class(schema))
+    return _validators[id(schema)][1]
+
+
+def validate(instance: Any, schema: dict[str, Any]) -> None:
+    """Validate an instance against a data model schema using its precompiled validator.
+
+    Args:
+        instance: Instance to validate.
+        schema: JSON schema to validate instance against.
+
+    Raises:
+        jsonschema.ValidationError: Raised if the instance is invalid. Like `jsonschema.validate`,
+            the most relevant error is raised.
+    """
+    from jsonschema.exceptions import best_match
+
+    if (error := best_match(validator(schema).iter_errors(instance))) is not None:
+        raise error
@@ -23,10 +23,31 @@ __all__ = [
     "SlurmConfig",
 ]
 
-import copy
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
 
-from .model import BaseModel, clean, format_key, generate_descriptors, marshall_content, parse_line
+from .model import (
+    BaseModel,
+    Option,
+    clean,
+    copy_data,
+    format_key,
+    leading_key,
+    marshall_content,
+    mentions_key,
+    parse_line,
+)
 from .option import (
     DownNodeOptionSet,
     FrontendNodeOptionSet,
@@ -34,12 +55,19 @@ from .option import (
     NodeSetOptionSet,
     PartitionOptionSet,
     SlurmConfigOptionSet,
+    _OptionSet,
 )
+from .table import NodeTable
+
+# Global options that may be set on multiple lines of slurm.conf.
+_ACCUMULATED_OPTIONS = frozenset({"Include", "SlurmctldHost"})
 
 
 class Node(BaseModel):
     """`Node` data model."""
 
+    __slots__ = ("__node_name",)
+
     def __init__(self, *, NodeName: str, **kwargs) -> None:  # noqa N803
         self.__node_name = NodeName
         super().__init__(NodeOptionSet, **kwargs)
@@ -68,7 +96,7 @@ class Node(BaseModel):
 
     def dict(self) -> Dict[str, Any]:
         """Return model as dictionary."""
-        return copy.deepcopy({self.__node_name: self.data})
+        return {self.__node_name: copy_data(self.data)}
 
     def __str__(self) -> str:
         """Return model as configuration line."""
@@ -80,6 +108,8 @@ class Node(BaseModel):
 class DownNodes(BaseModel):
     """`DownNodes` data model."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(DownNodeOptionSet, **kwargs)
 
@@ -97,6 +127,8 @@ class DownNodes(BaseModel):
 class FrontendNode(BaseModel):
     """`FrontendNode` data model."""
 
+    __slots__ = ("__frontend_name",)
+
     def __init__(self, *, FrontendName: str, **kwargs) -> None:  # noqa N803
         self.__frontend_name = FrontendName
         super().__init__(FrontendNodeOptionSet, **kwargs)
@@ -125,7 +157,7 @@ class FrontendNode(BaseModel):
 
     def dict(self) -> Dict[str, Any]:
         """Return model as dictionary."""
-        return copy.deepcopy({self.__frontend_name: self.data})
+        return {self.__frontend_name: copy_data(self.data)}
 
     def __str__(self) -> str:
         """Return model as configuration line."""
@@ -137,6 +169,8 @@ class FrontendNode(BaseModel):
 class NodeSet(BaseModel):
     """`NodeSet` data model."""
 
+    __slots__ = ("__node_set",)
+
     def __init__(self, *, NodeSet: str, **kwargs) -> None:  # noqa N803
         self.__node_set = NodeSet
         super().__init__(NodeSetOptionSet, **kwargs)
@@ -165,7 +199,7 @@ class NodeSet(BaseModel):
 
     def dict(self) -> Dict[str, Any]:
         """Return model as dictionary."""
-        return copy.deepcopy({self.__node_set: self.data})
+        return {self.__node_set: copy_data(self.data)}
 
     def __str__(self) -> str:
         """Return model as configuration line."""
@@ -177,6 +211,8 @@ class NodeSet(BaseModel):
 class Partition(BaseModel):
     """`Partition` data model."""
 
+    __slots__ = ("__partition_name",)
+
     def __init__(self, *, PartitionName: str, **kwargs):  # noqa N803
         self.__partition_name = PartitionName
         super().__init__(PartitionOptionSet, **kwargs)
@@ -205,7 +241,7 @@ class Partition(BaseModel):
 
     def dict(self) -> Dict[str, Any]:
         """Return model as dictionary."""
-        return copy.deepcopy({self.__partition_name: self.data})
+        return {self.__partition_name: copy_data(self.data)}
 
     def __str__(self) -> str:
         """Return model as configuration line."""
@@ -214,9 +250,27 @@ class Partition(BaseModel):
         return " ".join(line)
 
 
+class _Section(NamedTuple):
+    """Section of slurm.conf made up of lines that begin with the same key."""
+
+    key: str
+    name: str
+    model: Type[BaseModel]
+    options: Type[_OptionSet]
+    keyed: bool
+
+
 class SlurmConfig(BaseModel):
     """`slurm.conf` data model."""
 
+    __slots__ = ("_raw", "_columnar")
+
+    # Parsers for slurm.conf lines, keyed by the leading key of the line.
+    # Lines with an unregistered leading key are parsed as global options.
+    _handlers: ClassVar[Dict[str, Callable[[str], BaseModel]]] = {}
+    # Sections of slurm.conf, keyed by the leading key of their lines.
+    _sections: ClassVar[Dict[str, _Section]] = {}
+
     def __init__(
         self,
         *,
@@ -227,193 +281,408 @@ class SlurmConfig(BaseModel):
         Partitions: Optional[Dict[str, Any]] = None,  # noqa N803
         **kwargs,
     ) -> None:
+        sections = {
+            "Nodes": Nodes,
+            "DownNodes": DownNodes,
+            "FrontendNodes": FrontendNodes,
+            "NodeSets": NodeSets,
+            "Partitions": Partitions,
+        }
+        for section in self._sections.values():
+            if section.name in kwargs:
+                sections[section.name] = kwargs.pop(section.name)
+
         super().__init__(SlurmConfigOptionSet, **kwargs)
-        self.data["Nodes"] = Nodes or {}
-        self.data["DownNodes"] = DownNodes or []
-        self.data["FrontendNodes"] = FrontendNodes or {}
-        self.data["NodeSets"] = NodeSets or {}
-        self.data["Partitions"] = Partitions or {}
+        for section in self._sections.values():
+            if (value := sections.get(section.name)) is None:
+                value = {} if section.keyed else []
+            self.data[section.name] = value
+
+        # Configuration lines of lazily loaded sections that have not been decoded yet.
+        self._raw: Dict[str, List[str]] = {}
+        # Decode lazily loaded `Nodes` section into a `NodeTable`.
+        self._columnar = False
 
     @classmethod
-    def from_str(cls, content: str) -> "SlurmConfig":
-        """Construct SlurmConfig data model from slurm.conf format."""
-        data = {}
-        lines = content.splitlines()
-        for index, line in enumerate(lines):
-            config = clean(line)
-            if config is None:
-                continue
+    def register_handler(cls, key: str, handler: Callable[[str], BaseModel]) -> None:
+        """Register a parser for slurm.conf lines that begin with `key`.
+
+        Args:
+            key: Leading key of the configuration lines to parse.
+            handler: Callback that parses a configuration line into a data model.
+        """
+        cls._handlers[key] = handler
+
+    @classmethod
+    def register_section(
+        cls,
+        key: str,
+        name: str,
+        model: Type[BaseModel],
+        options: Type[_OptionSet],
+        keyed: bool = True,
+    ) -> None:
+        """Register a section made up of slurm.conf lines that begin with `key`.
+
+        Args:
+            key: Leading key of the section's configuration lines, e.g. `NodeName`.
+            name: Name of the section in the data model, e.g. `Nodes`.
+            model: Data model that each configuration line is parsed into. Models of
+                keyed sections must expose the value of `key` as the attribute
+                `format_key(key)`, e.g. `Node.node_name`.
+            options: Configuration options of the section's lines.
+            keyed: Map the value of `key` in each configuration line to the other options
+                of the line if `True`. Otherwise, store the section as a list of options.
+        """
+        cls._sections[key] = _Section(key, name, model, options, keyed)
+        cls.register_handler(key, model.from_str)
+
+    @classmethod
+    def from_str(
+        cls,
+        content: str,
+        *,
+        lazy: bool = False,
+        sections: Optional[Iterable[str]] = None,
+        keys: Optional[Iterable[str]] = None,
+        columnar: bool = False,
+    ) -> "SlurmConfig":
+        """Construct SlurmConfig data model from slurm.conf format.
+
+        Args:
+            content: slurm.conf content.
+            lazy: Defer parsing section lines until the section is first accessed.
+            sections: Only load these sections, e.g. `Partitions`.
+            keys: Only load these global options, e.g. `ClusterName`.
+            columnar: Store the `Nodes` section in a columnar `NodeTable`.
+        """
+        return cls.from_lines(
+            content.splitlines(), lazy=lazy, sections=sections, keys=keys, columnar=columnar
+        )
+
+    @classmethod
+    def from_lines(
+        cls,
+        fileobj: Iterable[str],
+        *,
+        lazy: bool = False,
+        sections: Optional[Iterable[str]] = None,
+        keys: Optional[Iterable[str]] = None,
+        columnar: bool = False,
+    ) -> "SlurmConfig":
+        """Construct SlurmConfig data model from a slurm.conf stream.
+
+        Args:
+            fileobj: Text stream, or any other iterable of lines, in slurm.conf format.
+            lazy: Defer parsing section lines until the section is first accessed.
+                Global options are always parsed immediately. Sections that are
+                never accessed are written back verbatim when the model is dumped.
+            sections: Only load these sections, e.g. `Partitions`.
+            keys: Only load these global options, e.g. `ClusterName`.
+            columnar: Store the `Nodes` section in a columnar `NodeTable`, which uses
+                far less memory for large node inventories than a `dict` per node.
+
+        Notes:
+            If either `sections` or `keys` is set, only the requested parts of slurm.conf
+            are loaded. Lines of other sections, and global lines that set none of `keys`,
+            are skipped before they are parsed.
+        """
+        configs = _iter_config(fileobj)
+        if sections is not None or keys is not None:
+            sections = frozenset(sections or ())
+            keys = frozenset(keys or ())
+
+            def wanted(key: str, config: str) -> bool:
+                if (section := cls._sections.get(key)) is not None:
+                    return section.name in sections
+                return mentions_key(config, keys)
+
+            configs = ((key, config) for key, config in configs if wanted(key, config))
+
+        raw = {}
+
+        def records() -> Iterator[BaseModel]:
+            for key, config in configs:
+                if lazy and (section := cls._sections.get(key)) is not None:
+                    raw.setdefault(section.name, []).append(config.strip())
+                else:
+                    yield cls._parse_record(key, config)
+
+        config = cls.from_records(records(), columnar=columnar)
+        if keys is not None:
+            names = {section.name for section in cls._sections.values()}
+            for k in [k for k in config.data if k not in keys and k not in names]:
+                del config.data[k]
+        for name in raw:
+            del config.data[name]
+        config._raw = raw
+        config._columnar = columnar
+        return config
 
-            if config.startswith("Include"):
-                _, v = config.split(maxsplit=1)
-                data["Include"] = data.get("Include", []) + [v]
-            elif config.startswith("SlurmctldHost"):
-                _, v = config.split("=", maxsplit=1)
-                data["SlurmctldHost"] = data.get("SlurmctldHost", []) + [v]
-            elif config.startswith("NodeName"):
-                nodes = data.get("Nodes", {})
-                nodes.update(Node.from_str(config).dict())
-                data["Nodes"] = nodes
-            elif config.startswith("DownNodes"):
-                data["DownNodes"] = data.get("DownNodes", []) + [DownNodes.from_str(config).dict()]
-            elif config.startswith("FrontendNode"):
-                frontend_nodes = data.get("FrontendNodes", {})
-                frontend_nodes.update(FrontendNode.from_str(config).dict())
-                data["FrontendNodes"] = frontend_nodes
-            elif config.startswith("NodeSet"):
-                node_sets = data.get("NodeSets", {})
-                node_sets.update(NodeSet.from_str(config).dict())
-                data["NodeSets"] = node_sets
-            elif config.startswith("PartitionName"):
-                partitions = data.get("Partitions", {})
-                partitions.update(Partition.from_str(config).dict())
-                data["Partitions"] = partitions
+    @classmethod
+    def from_records(
+        cls, records: Iterable[BaseModel], *, columnar: bool = False
+    ) -> "SlurmConfig":
+        """Construct SlurmConfig data model from records yielded by `iter_records`.
+
+        Args:
+            records: Iterable of slurm.conf records. `Include` and `SlurmctldHost`
+                entries are accumulated. Other global options are overwritten by
+                later records.
+            columnar: Store the `Nodes` section in a columnar `NodeTable`.
+        """
+        sections = {section.model: section for section in cls._sections.values()}
+        names = {section.name for section in sections.values()}
+        data = {section.name: {} if section.keyed else [] for section in sections.values()}
+        if columnar:
+            data["Nodes"] = NodeTable()
+        for record in records:
+            section = sections.get(type(record))
+            if section is None:
+                for k, v in record.data.items():
+                    if k in _ACCUMULATED_OPTIONS:
+                        data.setdefault(k, []).extend(v if isinstance(v, list) else [v])
+                    elif k not in names:
+                        data[k] = v
+            elif section.keyed:
+                data[section.name][getattr(record, format_key(section.key))] = record.data
             else:
-                data.update(parse_line(SlurmConfigOptionSet, config))
+                data[section.name].append(record.data)
 
-        return cls.from_dict(data)
+        return cls(**data)
 
-    def __str__(self) -> str:
-        """Return SlurmConfig data model in slurm.conf format."""
-        result = []
-        data = self.dict()
-        include = data.pop("Include", [])
-        slurmctld_host = data.pop("SlurmctldHost", [])
-        nodes = data.pop("Nodes", {})
-        down_nodes = data.pop("DownNodes", [])
-        frontend_nodes = data.pop("FrontendNodes", {})
-        node_sets = data.pop("NodeSets", {})
-        partitions = data.pop("Partitions", {})
+    @classmethod
+    def iter_records(cls, fileobj: Iterable[str]) -> Iterator[BaseModel]:
+        """Yield a data model for each configuration line of a slurm.conf stream.
+
+        Lines are read and parsed one at a time, so large configuration files
+        can be scanned or filtered without constructing the full data model.
+
+        Args:
+            fileobj: Text stream, or any other iterable of lines, in slurm.conf format.
 
-        if include:
-            result.extend([f"Include {i}" for i in include])
+        Yields:
+            `Node`, `DownNodes`, `FrontendNode`, `NodeSet`, or `Partition` data models
+            for section lines, and a `SlurmConfig` data model holding only the
+            global options of the line for all other lines.
+        """
+        for key, config in _iter_config(fileobj):
+            yield cls._parse_record(key, config)
 
-        if slurmctld_host:
-            result.extend([f"SlurmctldHost={host}" for host in slurmctld_host])
+    @classmethod
+    def _parse_record(cls, key: str, config: str) -> BaseModel:
+        """Parse a cleaned configuration line with the handler registered for `key`."""
+        if (handler := cls._handlers.get(key)) is None:
+            return cls(**parse_line(SlurmConfigOptionSet, config))
 
-        result.extend(marshall_content(SlurmConfigOptionSet, data))
+        return handler(config)
 
-        if nodes:
-            for k, v in nodes.items():
-                result.append(str(Node(NodeName=k, **v)))
+    def _section(self, name: str) -> Any:
+        """Get section of the data model, decoding it first if it was loaded lazily."""
+        if (lines := self._raw.pop(name, None)) is not None:
+            handler = next(s.model.from_str for s in self._sections.values() if s.name == name)
+            records = (handler(line) for line in lines)
+            self.data[name] = self.from_records(records, columnar=self._columnar).data[name]
 
-        if down_nodes:
-            for entry in down_nodes:
-                result.append(str(DownNodes(**entry)))
+        return self.data[name]
 
-        if frontend_nodes:
-            for k, v in frontend_nodes.items():
-                result.append(str(FrontendNode(FrontendName=k, **v)))
+    def dict(self) -> Dict[str, Any]:
+        """Return model as dictionary."""
+        for name in list(self._raw):
+            self._section(name)
 
-        if node_sets:
-            for k, v in node_sets.items():
-                result.append(str(NodeSet(NodeSet=k, **v)))
+        tables = {k: v.dict() for k, v in self.data.items() if isinstance(v, NodeTable)}
+        if not tables:
+            return super().dict()
 
-        if partitions:
-            for k, v in partitions.items():
-                result.append(str(Partition(PartitionName=k, **v)))
+        data = copy_data(self._slice(tables))
+        return {k: tables[k] if k in tables else data[k] for k in self.data}
 
-        return "\n".join(result)
+    def __str__(self) -> str:
+        """Return SlurmConfig data model in slurm.conf format."""
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield SlurmConfig data model as slurm.conf configuration lines."""
+        data = self.data
+        sections = self._sections.values()
+
+        for i in data.get("Include") or []:
+            yield f"Include {i}"
+        for host in data.get("SlurmctldHost") or []:
+            yield f"SlurmctldHost={host}"
+        yield from marshall_content(
+            SlurmConfigOptionSet,
+            self._slice(["Include", "SlurmctldHost", *(s.name for s in sections)]),
+        )
+
+        # Marshall section entries directly from the option tables rather than
+        # constructing a data model for every entry.
+        for section in sections:
+            if section.name in self._raw:
+                yield from self._raw[section.name]
+            elif section.keyed:
+                entries = data[section.name]
+                rows = entries.rows() if isinstance(entries, NodeTable) else entries.items()
+                for k, v in rows:
+                    yield " ".join([f"{section.key}={k}", *marshall_content(section.options, v)])
+            else:
+                for entry in data[section.name]:
+                    yield " ".join(marshall_content(section.options, entry))
 
     @property
     def nodes(self):
         """Get map of all nodes in the Slurm configuration."""
-        return self.data["Nodes"]
+        return self._section("Nodes")
 
     @nodes.setter
     def nodes(self, value):
         """Set new node mapping for the Slurm configuration."""
+        self._raw.pop("Nodes", None)
         self.data["Nodes"] = value
 
     @nodes.deleter
     def nodes(self):
         """Delete entire node mapping in the Slurm configuration."""
+        self._raw.pop("Nodes", None)
         self.data["Nodes"] = {}
 
     @property
     def down_nodes(self):
         """Get list of all down nodes in the Slurm configuration."""
-        return self.data["DownNodes"]
+        return self._section("DownNodes")
 
     @down_nodes.setter
     def down_nodes(self, value):
         """Set new down node list for the Slurm configuration."""
+        self._raw.pop("DownNodes", None)
         self.data["DownNodes"] = value
 
     @down_nodes.deleter
     def down_nodes(self):
         """Delete entire down node list in the Slurm configuration."""
+        self._raw.pop("DownNodes", None)
         self.data["DownNodes"] = []
 
     @property
     def frontend_nodes(self):
         """Get map of all frontend nodes in the Slurm configuration."""
-        return self.data["FrontendNodes"]
+        return self._section("FrontendNodes")
 
     @frontend_nodes.setter
     def frontend_nodes(self, value):
         """Set new frontend node mapping for the Slurm configuration."""
+        self._raw.pop("FrontendNodes", None)
         self.data["FrontendNodes"] = value
 
     @frontend_nodes.deleter
     def frontend_nodes(self):
         """Delete entire frontend node mapping in the Slurm configuration."""
+        self._raw.pop("FrontendNodes", None)
         self.data["FrontendNodes"] = {}
 
     @property
     def node_sets(self):
         """Get map of all node sets in the Slurm configuration."""
-        return self.data["NodeSets"]
+        return self._section("NodeSets")
 
     @node_sets.setter
     def node_sets(self, value):
         """Set new node set mapping for the Slurm configuration."""
+        self._raw.pop("NodeSets", None)
         self.data["NodeSets"] = value
 
     @node_sets.deleter
     def node_sets(self):
         """Delete entire node set mapping in the Slurm configuration."""
+        self._raw.pop("NodeSets", None)
         self.data["NodeSets"] = {}
 
     @property
     def partitions(self):
         """Get map of all partitions in the Slurm configuration."""
-        return self.data["Partitions"]
+        return self._section("Partitions")
 
     @partitions.setter
     def partitions(self, value):
         """Set partition mapping for the Slurm configuration."""
+        self._raw.pop("Partitions", None)
         self.data["Partitions"] = value
 
     @partitions.deleter
     def partitions(self):
         """Delete entire partition mapping in the Slurm configuration."""
+        self._raw.pop("Partitions", None)
         self.data["Partitions"] = {}
 
     def update(self, other: "SlurmConfig") -> None:
-        """Update the fields of this model with the fields of another model."""
-        for config, value in other.dict().items():
-            if config in ["Nodes", "FrontendNodes", "NodeSets", "Partitions"]:
-                for k, v in value.items():
-                    data = self.data[config].get(k, {})
-                    data.update(v)
-                    self.data[config][k] = data
+        """Update the fields of this model with the fields of another model.
+
+        Only the sections that `other` sets are decoded and merged, and only the values
+        that are merged are copied.
+        """
+        for name in list(other._raw):
+            other._section(name)
+
+        sections = {section.name: section for section in self._sections.values()}
+        for config, value in other.data.items():
+            section = sections.get(config)
+            if section is None:
+                self.data[config] = copy_data(value)
                 continue
-            if config == "DownNodes":
-                self.data["DownNodes"] = self.data["DownNodes"] + value
+
+            if not value:
                 continue
-            self.data.update({config: value})
-
-
-for opt in NodeOptionSet.keys():
-    setattr(Node, format_key(opt), property(*generate_descriptors(opt)))
-for opt in DownNodeOptionSet.keys():
-    setattr(DownNodes, format_key(opt), property(*generate_descriptors(opt)))
-for opt in FrontendNodeOptionSet.keys():
-    setattr(FrontendNode, format_key(opt), property(*generate_descriptors(opt)))
-for opt in NodeSetOptionSet.keys():
-    setattr(NodeSet, format_key(opt), property(*generate_descriptors(opt)))
-for opt in PartitionOptionSet.keys():
-    setattr(Partition, format_key(opt), property(*generate_descriptors(opt)))
-for opt in SlurmConfigOptionSet.keys():
-    setattr(SlurmConfig, format_key(opt), property(*generate_descriptors(opt)))
+
+            target = self._section(config)
+            if section.keyed:
+                for k, v in value.items():
+                    data = target.get(k, {})
+                    data.update({opt: copy_data(val) for opt, val in v.items()})
+                    target[k] = data
+            else:
+                self.data[config] = target + copy_data(list(value))
+
+
+def _iter_config(fileobj: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yield the leading key and cleaned content of each configuration line."""
+    for line in fileobj:
+        config = clean(line.rstrip("\r\n"))
+        if config is None or config.isspace():
+            continue
+
+        yield leading_key(config), config
+
+
+def _include_from_str(line: str) -> SlurmConfig:
+    """Parse `Include` configuration line."""
+    _, v = line.split(maxsplit=1)
+    return SlurmConfig(Include=[v])
+
+
+def _slurmctld_host_from_str(line: str) -> SlurmConfig:
+    """Parse `SlurmctldHost` configuration line."""
+    _, v = line.split("=", maxsplit=1)
+    return SlurmConfig(SlurmctldHost=[v])
+
+
+SlurmConfig.register_handler("Include", _include_from_str)
+SlurmConfig.register_handler("SlurmctldHost", _slurmctld_host_from_str)
+SlurmConfig.register_section("NodeName", "Nodes", Node, NodeOptionSet)
+SlurmConfig.register_section("DownNodes", "DownNodes", DownNodes, DownNodeOptionSet, keyed=False)
+SlurmConfig.register_section("FrontendName", "FrontendNodes", FrontendNode, FrontendNodeOptionSet)
+SlurmConfig.register_section("NodeSet", "NodeSets", NodeSet, NodeSetOptionSet)
+SlurmConfig.register_section("PartitionName", "Partitions", Partition, PartitionOptionSet)
+
+# Do not replace explicitly defined accessors such as `Node.node_name`.
+for model, option_set in (
+    (Node, NodeOptionSet),
+    (DownNodes, DownNodeOptionSet),
+    (FrontendNode, FrontendNodeOptionSet),
+    (NodeSet, NodeSetOptionSet),
+    (Partition, PartitionOptionSet),
+    (SlurmConfig, SlurmConfigOptionSet),
+):
+    for opt in option_set.keys():
+        if not hasattr(model, format_key(opt)):
+            setattr(model, format_key(opt), Option(opt))
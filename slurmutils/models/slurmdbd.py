@@ -14,19 +14,40 @@
 
 """Data models for `slurmdbd.conf` configuration file."""
 
-from .model import BaseModel, clean, format_key, generate_descriptors, marshall_content, parse_line
+from typing import Iterable, Iterator, Optional
+
+from .model import (
+    BaseModel,
+    Option,
+    clean,
+    format_key,
+    marshall_content,
+    mentions_key,
+    parse_line,
+)
 from .option import SlurmdbdConfigOptionSet
 
 
 class SlurmdbdConfig(BaseModel):
     """`slurmdbd.conf` data model."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(SlurmdbdConfigOptionSet, **kwargs)
 
     @classmethod
-    def from_str(cls, content: str) -> "SlurmdbdConfig":
-        """Construct SlurmdbdConfig data model from slurmdbd.conf format."""
+    def from_str(cls, content: str, *, keys: Optional[Iterable[str]] = None) -> "SlurmdbdConfig":
+        """Construct SlurmdbdConfig data model from slurmdbd.conf format.
+
+        Args:
+            content: slurmdbd.conf content.
+            keys: Only load these configuration options. Lines that set none of them
+                are skipped before they are parsed.
+        """
+        if keys is not None:
+            keys = frozenset(keys)
+
         data = {}
         lines = content.splitlines()
         for index, line in enumerate(lines):
@@ -34,16 +55,22 @@ class SlurmdbdConfig(BaseModel):
             if config is None:
                 continue
 
-            data.update(parse_line(SlurmdbdConfigOptionSet, config))
+            if keys is None:
+                data.update(parse_line(SlurmdbdConfigOptionSet, config))
+            elif mentions_key(config, keys):
+                options = parse_line(SlurmdbdConfigOptionSet, config)
+                data.update({k: v for k, v in options.items() if k in keys})
 
         return cls.from_dict(data)
 
     def __str__(self) -> str:
         """Return SlurmdbdConfig data model in slurmdbd.conf format."""
-        result = []
-        result.extend(marshall_content(SlurmdbdConfigOptionSet, self.dict()))
-        return "\n".join(result)
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield SlurmdbdConfig data model as slurmdbd.conf configuration lines."""
+        yield from marshall_content(SlurmdbdConfigOptionSet, self.data)
 
 
 for opt in SlurmdbdConfigOptionSet.keys():
-    setattr(SlurmdbdConfig, format_key(opt), property(*generate_descriptors(opt)))
+    setattr(SlurmdbdConfig, format_key(opt), Option(opt))
@@ -0,0 +1,250 @@
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Columnar storage for large `slurm.conf` node inventories."""
+
+__all__ = ["NodeTable"]
+
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any, Dict, List, Optional, Tuple
+
+# Rows are compacted once more than this fraction of them has been deleted.
+_COMPACT_RATIO = 0.5
+
+
+class _Column:
+    """Categorically encoded values of a single node option.
+
+    Each row stores a code into `values`. Code `0` marks rows that do not set the option.
+    """
+
+    __slots__ = ("codes", "values", "index")
+
+    def __init__(self, rows: int) -> None:
+        self.codes = array("I", bytes(rows * array("I").itemsize))
+        self.values: List[Any] = [None]
+        self.index: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        """Get code of a value, adding the value to the column's categories if it is new."""
+        if isinstance(value, list):
+            value = tuple(value)
+        elif isinstance(value, str):
+            value = sys.intern(value)
+
+        try:
+            code = self.index.setdefault(value, len(self.values))
+        except TypeError:
+            # Unhashable values, e.g. dicts, are stored without deduplication.
+            code = len(self.values)
+
+        if code == len(self.values):
+            self.values.append(value)
+
+        return code
+
+    def decode(self, code: int) -> Any:
+        """Get value of a code. List values are returned as new lists."""
+        value = self.values[code]
+        return list(value) if isinstance(value, tuple) else value
+
+
+class NodeTable(MutableMapping[str, MutableMapping[str, Any]]):
+    """Columnar map of node names to node configuration options.
+
+    `NodeTable` can be used in place of the `dict` of node options in `SlurmConfig.nodes`.
+    Rather than keeping a dictionary per node, each option is stored as an array of codes
+    into the distinct values of the option, and node names are mapped to rows of the
+    arrays. Large node inventories that repeat the same values, such as `CPUs` or
+    `State`, use a fraction of the memory. The order of the options of each node is
+    stored the same way, as a code into the distinct option orders of the table.
+
+    Args:
+        nodes: Map of node names to node configuration options to fill the table with.
+
+    Notes:
+        Looking up a node returns a mutable view of the node's row rather than a `dict`.
+        List values, such as `Features`, are returned as new lists, so they must be
+        reassigned to the view to change them. Options of a node are kept in the order
+        in which they were added to the node, as in a `dict`.
+    """
+
+    __slots__ = ("_names", "_index", "_columns", "_order", "_layouts", "_layout_index", "_deleted")
+
+    def __init__(self, nodes: Optional[Mapping[str, Mapping[str, Any]]] = None) -> None:
+        self._names: List[Optional[str]] = []
+        self._index: Dict[str, int] = {}
+        self._columns: Dict[str, _Column] = {}
+        # Each row stores a code into `_layouts`, the distinct orders of row options.
+        self._order = array("I")
+        self._layouts: List[Tuple[str, ...]] = [()]
+        self._layout_index: Dict[Tuple[str, ...], int] = {(): 0}
+        self._deleted = 0
+        if nodes:
+            self.update(nodes)
+
+    def __getitem__(self, name: str) -> "_NodeRow":  # noqa D105
+        if name not in self._index:
+            raise KeyError(name)
+
+        return _NodeRow(self, name)
+
+    def __setitem__(self, name: str, options: Mapping[str, Any]) -> None:  # noqa D105
+        options = list(options.items())
+        if (row := self._index.get(name)) is None:
+            row = len(self._names)
+            self._names.append(name)
+            self._index[name] = row
+            self._order.append(0)
+            for column in self._columns.values():
+                column.codes.append(0)
+        else:
+            self._clear(row)
+
+        for k, v in options:
+            self._encode(row, k, v)
+        self._order[row] = self._layout(tuple(k for k, _ in options))
+
+    def __delitem__(self, name: str) -> None:  # noqa D105
+        row = self._index.pop(name)
+        self._names[row] = None
+        self._clear(row)
+        self._deleted += 1
+        if self._deleted > len(self._names) * _COMPACT_RATIO:
+            self._compact()
+
+    def __iter__(self) -> Iterator[str]:  # noqa D105
+        return (name for name in self._names if name is not None)
+
+    def __len__(self) -> int:  # noqa D105
+        return len(self._index)
+
+    def __repr__(self) -> str:  # noqa D105
+        return f"{type(self).__name__}({self.dict()!r})"
+
+    def dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return node table as dictionary of node names to node configuration options."""
+        return dict(self.rows())
+
+    def rows(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield node names with a dictionary of their configuration options.
+
+        Faster than iterating over `items()` when every option of every node is read.
+        """
+        layouts = [
+            [(k, self._columns[k].codes, self._columns[k].decode) for k in layout]
+            for layout in self._layouts
+        ]
+        order = self._order
+        for name, row in self._index.items():
+            yield name, {k: decode(codes[row]) for k, codes, decode in layouts[order[row]]}
+
+    def _row(self, row: int) -> Dict[str, Any]:
+        """Get options of a row as a dictionary."""
+        return {k: self._columns[k].decode(self._columns[k].codes[row]) for k in self._keys(row)}
+
+    def _get(self, row: int, key: str) -> Any:
+        """Get value of option `key` in `row`."""
+        column = self._columns.get(key)
+        if column is None or not (code := column.codes[row]):
+            raise KeyError(key)
+
+        return column.decode(code)
+
+    def _set(self, row: int, key: str, value: Any) -> None:
+        """Set value of option `key` in `row`."""
+        if not self._encode(row, key, value):
+            self._order[row] = self._layout(self._layouts[self._order[row]] + (key,))
+
+    def _encode(self, row: int, key: str, value: Any) -> bool:
+        """Store value of option `key` in `row`. Return whether the option was already set."""
+        if (column := self._columns.get(key)) is None:
+            column = self._columns[key] = _Column(len(self._names))
+
+        was_set = bool(column.codes[row])
+        column.codes[row] = column.encode(value)
+        return was_set
+
+    def _delete(self, row: int, key: str) -> None:
+        """Unset option `key` in `row`."""
+        column = self._columns.get(key)
+        if column is None or not column.codes[row]:
+            raise KeyError(key)
+
+        column.codes[row] = 0
+        layout = self._layouts[self._order[row]]
+        self._order[row] = self._layout(tuple(k for k in layout if k != key))
+
+    def _keys(self, row: int) -> Tuple[str, ...]:
+        """Get options that are set in `row`, in the order in which they were added."""
+        return self._layouts[self._order[row]]
+
+    def _layout(self, layout: Tuple[str, ...]) -> int:
+        """Get code of an order of row options, adding it to the table if it is new."""
+        code = self._layout_index.setdefault(layout, len(self._layouts))
+        if code == len(self._layouts):
+            self._layouts.append(layout)
+
+        return code
+
+    def _clear(self, row: int) -> None:
+        """Unset all options in `row`."""
+        for k in self._keys(row):
+            self._columns[k].codes[row] = 0
+        self._order[row] = 0
+
+    def _compact(self) -> None:
+        """Drop rows of deleted nodes."""
+        rows = [row for row, name in enumerate(self._names) if name is not None]
+        for column in self._columns.values():
+            column.codes = array("I", (column.codes[row] for row in rows))
+        self._order = array("I", (self._order[row] for row in rows))
+
+        self._names = [self._names[row] for row in rows]
+        self._index = {name: row for row, name in enumerate(self._names)}
+        self._deleted = 0
+
+
+class _NodeRow(MutableMapping[str, Any]):
+    """Mutable view of the configuration options of a node in a `NodeTable`."""
+
+    __slots__ = ("_table", "_name")
+
+    def __init__(self, table: NodeTable, name: str) -> None:
+        self._table = table
+        self._name = name
+
+    @property
+    def _row(self) -> int:
+        return self._table._index[self._name]
+
+    def __getitem__(self, key: str) -> Any:  # noqa D105
+        return self._table._get(self._row, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:  # noqa D105
+        self._table._set(self._row, key, value)
+
+    def __delitem__(self, key: str) -> None:  # noqa D105
+        self._table._delete(self._row, key)
+
+    def __iter__(self) -> Iterator[str]:  # noqa D105
+        return iter(self._table._keys(self._row))
+
+    def __len__(self) -> int:  # noqa D105
+        return len(self._table._keys(self._row))
+
+    def __repr__(self) -> str:  # noqa D105
+        return repr(self._table._row(self._row))
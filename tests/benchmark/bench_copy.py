@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark copying data out of and merging data into `SlurmConfig` data models."""
+
+import copy
+
+from synthetic import slurm_config, timeit
+
+from slurmutils.models import SlurmConfig
+from slurmutils.models.model import copy_data
+
+PARTITIONS = {"Partitions": {"debug": {"Nodes": ["node-0"], "MaxTime": "30"}}}
+
+
+def update_and_dump(content: str) -> float:
+    """Time updating the partitions of a lazily loaded config and writing it back out."""
+
+    def run() -> None:
+        config = SlurmConfig.from_str(content, lazy=True)
+        config.update(SlurmConfig(**PARTITIONS))
+        str(config)
+
+    return timeit(run) - timeit(lambda: str(SlurmConfig.from_str(content, lazy=True)))
+
+
+if __name__ == "__main__":
+    for nodes in (1_000, 30_000):
+        content = slurm_config(nodes)
+        config = SlurmConfig.from_str(content)
+        assert copy_data(config.data) == copy.deepcopy(config.data)
+
+        deep = timeit(lambda: copy.deepcopy(config.data))
+        shared = timeit(lambda: copy_data(config.data))
+        print(f"slurm.conf with {nodes} nodes")
+        print(f"  dict(): deepcopy {deep:.3f}s  copy_data {shared:.3f}s")
+        print(f"  update() + dumps() overhead on untouched nodes: {update_and_dump(content):.4f}s")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark configuration option descriptors of the Slurm data models."""
+
+import subprocess
+import sys
+import timeit
+
+from slurmutils.models import SlurmConfig
+from slurmutils.models.model import Option
+from slurmutils.models.option import SlurmConfigOptionSet
+
+# `slurmutils.models` imports its modules lazily, so they are imported explicitly.
+MODULES = ["slurmutils.models.slurm", "slurmutils.models.cgroup", "slurmutils.models.slurmdbd"]
+ACCESSES = 1_000_000
+
+
+def import_times(repeat: int = 5) -> dict[str, int]:
+    """Return the best `-X importtime` self time in microseconds of the data model modules."""
+    best = dict.fromkeys(MODULES, sys.maxsize)
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {', '.join(MODULES)}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        for line in out.splitlines():
+            self_us, _, name = line.removeprefix("import time:").split("|")
+            if (name := name.strip()) in best:
+                best[name] = min(best[name], int(self_us))
+
+    return best
+
+
+def closures(opt: str) -> property:
+    """Create a property from per-option closures, as models did before `Option`."""
+
+    def getter(self):
+        return self.data.get(opt, None)
+
+    def setter(self, value):
+        self.data[opt] = value
+
+    def deleter(self):
+        del self.data[opt]
+
+    return property(getter, setter, deleter)
+
+
+if __name__ == "__main__":
+    print("import time (self, best of 5)")
+    for name, us in import_times().items():
+        print(f"  {name:<26}: {us / 1000:6.2f}ms")
+
+    opts = list(SlurmConfigOptionSet.keys())
+    create = {
+        "property": min(timeit.repeat(lambda: [closures(opt) for opt in opts], number=100)),
+        "Option": min(timeit.repeat(lambda: [Option(opt) for opt in opts], number=100)),
+    }
+    print(f"create {len(opts)} SlurmConfig descriptors (x100)")
+    for kind, t in create.items():
+        print(f"  {kind:<8}: {t * 1000:6.2f}ms")
+
+    Legacy = type("Legacy", (SlurmConfig,), {"slurmctld_port": closures("SlurmctldPort")})
+    print(f"config.slurmctld_port (x{ACCESSES})")
+    for kind, config in [("property", Legacy(SlurmctldPort=6817)), ("Option", SlurmConfig())]:
+        config.slurmctld_port = 6817
+        get = min(timeit.repeat(lambda: config.slurmctld_port, number=ACCESSES))
+        put = min(timeit.repeat("config.slurmctld_port = 6817", globals=locals(), number=ACCESSES))
+        print(f"  {kind:<8}: get {get * 1000:6.1f}ms  set {put * 1000:6.1f}ms")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark dumping a large `slurm.conf` data model."""
+
+from synthetic import slurm_config, timeit
+
+from slurmutils.models import DownNodes, Node, Partition, SlurmConfig
+
+
+def reference(config: SlurmConfig) -> str:
+    """Render slurm.conf by constructing a data model for every section entry."""
+    data = config.dict()
+    result = [f"SlurmctldHost={host}" for host in data.pop("SlurmctldHost", [])]
+    nodes = data.pop("Nodes")
+    down_nodes = data.pop("DownNodes")
+    partitions = data.pop("Partitions")
+    del data["FrontendNodes"], data["NodeSets"]
+    result.extend(str(SlurmConfig(**data)).splitlines())
+    result.extend(str(Node(NodeName=k, **v)) for k, v in nodes.items())
+    result.extend(str(DownNodes(**entry)) for entry in down_nodes)
+    result.extend(str(Partition(PartitionName=k, **v)) for k, v in partitions.items())
+    return "\n".join(result)
+
+
+if __name__ == "__main__":
+    config = SlurmConfig.from_str(slurm_config(20_000, 1_000))
+    assert str(config) == reference(config)
+
+    baseline = timeit(lambda: reference(config))
+    direct = timeit(lambda: str(config))
+    print("dump slurm.conf with 20000 nodes")
+    print(f"  per-entry data models: {baseline:.3f}s")
+    print(f"  str(SlurmConfig):      {direct:.3f}s ({baseline / direct:.1f}x)")
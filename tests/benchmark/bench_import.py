@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark time taken to import `slurmutils` in a fresh interpreter."""
+
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import slurmutils",
+    "from slurmutils import calculate_rs",
+    "from slurmutils.editors import cgroupconfig",
+    "from slurmutils.editors import slurmconfig",
+    "from slurmutils.editors import gresconfig",
+    "from slurmutils.models import *",
+]
+
+# Modules that must only be imported when they are actually needed.
+DEFERRED = {
+    "from slurmutils.editors import cgroupconfig": ["jsonschema", "asyncio", "importlib.metadata"],
+    "from slurmutils.editors import slurmconfig": ["jsonschema", "asyncio", "importlib.metadata"],
+}
+
+
+def importtime(statement: str) -> list[tuple[int, str]]:
+    """Return `-X importtime` cumulative times in microseconds and names of imported modules."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    lines = [line.removeprefix("import time:").split("|") for line in out.splitlines()[1:]]
+    return [(int(cumulative), name[1:].rstrip()) for _, cumulative, name in lines]
+
+
+def import_time(statement: str, repeat: int = 5) -> tuple[float, set[str]]:
+    """Return best import time in seconds of `statement` and the modules that it imports.
+
+    Modules imported by the interpreter at startup are not counted.
+    """
+    startup = {name for _, name in importtime("pass")}
+    best, modules = float("inf"), set()
+    for _ in range(repeat):
+        imports = [(us, name) for us, name in importtime(statement) if name not in startup]
+        modules = {name.strip() for _, name in imports}
+        best = min(best, sum(us for us, name in imports if not name.startswith(" ")) / 1e6)
+
+    return best, modules
+
+
+if __name__ == "__main__":
+    print("import time (cumulative, best of 5)")
+    for statement in STATEMENTS:
+        seconds, modules = import_time(statement)
+        print(f"  {statement:<45}: {seconds * 1000:6.1f}ms")
+        for module in DEFERRED.get(statement, []):
+            assert module not in modules, f"{statement!r} imports {module}"
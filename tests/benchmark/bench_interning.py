@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark memory saved by interning parsed configuration values."""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from synthetic import gres_config, slurm_config, timeit
+
+from slurmutils.models import GRESConfig, SlurmConfig
+from slurmutils.models.model import interning
+
+
+def retained_bytes(load: Callable[[], object]) -> int:
+    """Return traced bytes retained by the data model returned by `load`."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    model = load()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del model
+    return used
+
+
+def interned(load: Callable[[], object]) -> Callable[[], object]:
+    """Wrap `load` so that it interns parsed values in a per-parse intern table."""
+
+    def wrapper() -> object:
+        with interning():
+            return load()
+
+    return wrapper
+
+
+if __name__ == "__main__":
+    slurm = slurm_config(30_000)
+    gres = gres_config(20_000)
+    for name, load in [
+        ("slurm.conf with 30000 nodes", lambda: SlurmConfig.from_str(slurm)),
+        ("gres.conf with 20000 GPUs", lambda: GRESConfig.from_str(gres)),
+    ]:
+        assert str(load()) == str(interned(load)())
+        print(name)
+        for label, func in [("plain", load), ("interned", interned(load))]:
+            used = retained_bytes(func)
+            print(f"  {label:<8}: {used / 2**20:6.1f}MiB  load {timeit(func):.3f}s")
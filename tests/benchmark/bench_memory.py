@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark memory used per data model instance."""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from slurmutils.models import GRESName, GRESNode, Node, Partition
+
+COUNT = 50_000
+
+
+def with_dict(cls: type) -> type:
+    """Create a subclass of `cls` whose instances carry a `__dict__`, like unslotted models."""
+    return type(cls.__name__, (cls,), {})
+
+
+def bytes_per_instance(factory: Callable[[int], object]) -> float:
+    """Return traced bytes allocated per instance created by `factory`."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    instances = [factory(i) for i in range(COUNT)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del instances
+    return used / COUNT
+
+
+def node(cls: type) -> Callable[[int], object]:
+    """Create factory of `Node` data models."""
+    return lambda i: cls(NodeName=f"node-{i}", CPUs="128", RealMemory="512000", State="UNKNOWN")
+
+
+def partition(cls: type) -> Callable[[int], object]:
+    """Create factory of `Partition` data models."""
+    return lambda i: cls(PartitionName=f"part-{i}", Nodes="ALL", MaxTime="120", State="UP")
+
+
+def gres_name(cls: type) -> Callable[[int], object]:
+    """Create factory of `GRESName` data models."""
+    return lambda i: cls(Name="gpu", Type="a100", File=f"/dev/nvidia{i}")
+
+
+def gres_node(cls: type) -> Callable[[int], object]:
+    """Create factory of `GRESNode` data models."""
+    return lambda i: cls(NodeName=f"node-{i}", Name="gpu", Type="a100", File=f"/dev/nvidia{i}")
+
+
+if __name__ == "__main__":
+    print(f"traced bytes per data model instance ({COUNT} instances)")
+    for model, factory in [
+        (Node, node),
+        (Partition, partition),
+        (GRESName, gres_name),
+        (GRESNode, gres_node),
+    ]:
+        unslotted = bytes_per_instance(factory(with_dict(model)))
+        slotted = bytes_per_instance(factory(model))
+        print(
+            f"  {model.__name__:<10} with __dict__: {unslotted:6.0f}B  "
+            + f"__slots__: {slotted:6.0f}B ({unslotted - slotted:+.0f}B)"
+        )
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark memory used by the `Nodes` section of a large `slurm.conf`."""
+
+import gc
+import tracemalloc
+
+from synthetic import slurm_config, timeit
+
+from slurmutils.models import SlurmConfig
+
+NODES = 30_000
+
+
+def retained_bytes(content: str, columnar: bool) -> int:
+    """Return traced bytes retained by a `SlurmConfig` data model loaded from `content`."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    config = SlurmConfig.from_str(content, columnar=columnar)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del config
+    return used
+
+
+if __name__ == "__main__":
+    content = slurm_config(NODES)
+    assert str(SlurmConfig.from_str(content, columnar=True)) == str(SlurmConfig.from_str(content))
+
+    print(f"slurm.conf with {NODES} nodes")
+    for columnar in (False, True):
+        used = retained_bytes(content, columnar)
+        load = timeit(lambda: SlurmConfig.from_str(content, columnar=columnar))
+        config = SlurmConfig.from_str(content, columnar=columnar)
+        dump = timeit(lambda: str(config))
+        print(
+            f"  {'NodeTable' if columnar else 'dict':<9}: {used / 2**20:6.1f}MiB "
+            + f"({used / NODES:4.0f}B/node)  load {load:.3f}s  dump {dump:.3f}s"
+        )
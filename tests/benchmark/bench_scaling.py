@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark how parse time grows with the number of configuration entries.
+
+Linear parsers should show a roughly constant time per entry across sizes.
+"""
+
+from synthetic import gres_config, slurm_config, timeit
+
+from slurmutils.models import GRESConfig, SlurmConfig
+
+SIZES = (1_000, 10_000, 100_000)
+
+if __name__ == "__main__":
+    print("SlurmConfig.from_str with N DownNodes entries")
+    for n in SIZES:
+        content = slurm_config(0, down_nodes=n)
+        elapsed = timeit(lambda: SlurmConfig.from_str(content), repeat=1)
+        print(f"  {n:>7}: {elapsed:.3f}s ({elapsed / n * 1e6:.1f}us/entry)")
+
+    print("GRESConfig.from_str with N NodeName entries")
+    for n in SIZES:
+        content = gres_config(n)
+        elapsed = timeit(lambda: GRESConfig.from_str(content), repeat=1)
+        print(f"  {n:>7}: {elapsed:.3f}s ({elapsed / n * 1e6:.1f}us/entry)")
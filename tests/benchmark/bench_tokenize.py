@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark the configuration line lexer against `shlex.split`."""
+
+import shlex
+
+from synthetic import slurm_config, timeit
+
+from slurmutils.models.model import clean, tokenize
+
+if __name__ == "__main__":
+    lines = [line for line in map(clean, slurm_config(40_000, 1_000).splitlines()) if line]
+    assert [tokenize(line) for line in lines] == [shlex.split(line) for line in lines]
+
+    baseline = timeit(lambda: [shlex.split(line) for line in lines])
+    lexer = timeit(lambda: [tokenize(line) for line in lines])
+    print(f"tokenize {len(lines)} lines")
+    print(f"  shlex.split: {baseline:.3f}s")
+    print(f"  tokenize:    {lexer:.3f}s ({baseline / lexer:.1f}x)")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark validation of `gres.conf` data model mappings and configuration files."""
+
+import jsonschema
+from synthetic import gres_config, slurm_config, timeit
+
+from slurmutils.editors import gresconfig, slurmconfig
+from slurmutils.models import GRESNameMapping, GRESNodeMapping
+from slurmutils.models.model import VALIDATION_LEVELS, validation_level
+from slurmutils.models.schema import GRES_NAME_MAPPING_SCHEMA, GRES_NAME_SCHEMA, validator
+
+ENTRIES = 10_000
+# `jsonschema.validate` is too slow to run on every entry, so it is timed on a sample.
+SAMPLE = 50
+
+
+def gres_names(count: int) -> dict[str, list[dict[str, object]]]:
+    """Generate map of a GRES name to `count` GPUs."""
+    return {
+        "gpu": [
+            {"Name": "gpu", "Type": "a100", "File": f"/dev/nvidia{i}", "Cores": ["0", "1"]}
+            for i in range(count)
+        ]
+    }
+
+
+def gres_nodes(count: int, per_node: int = 8) -> dict[str, list[dict[str, object]]]:
+    """Generate map of node names to `count` GPUs spread `per_node` to a node."""
+    nodes = {}
+    for i in range(count):
+        node = f"node-{i // per_node}"
+        nodes.setdefault(node, []).append(
+            {"NodeName": node, "Name": "gpu", "File": f"/dev/nvidia{i % per_node}"}
+        )
+    return nodes
+
+
+if __name__ == "__main__":
+    entries = gres_names(SAMPLE)["gpu"]
+    uncached = timeit(lambda: [jsonschema.validate(e, GRES_NAME_SCHEMA) for e in entries], 1)
+    cached = timeit(lambda: [validator(GRES_NAME_SCHEMA).validate(e) for e in entries])
+    print(f"validate one gres.conf name ({SAMPLE} samples)")
+    print(f"  jsonschema.validate: {uncached / SAMPLE * 1e6:8.1f}us")
+    print(f"  cached validator   : {cached / SAMPLE * 1e6:8.1f}us")
+
+    names = gres_names(2_000)
+    stock = jsonschema.Draft202012Validator(GRES_NAME_MAPPING_SCHEMA)
+    print("uniqueItems check of 2000 gres.conf names")
+    print(f"  Draft202012Validator: {timeit(lambda: stock.validate(names), 1):6.3f}s")
+    print(
+        f"  cached validator    : {timeit(lambda: validator(stock.schema).validate(names)):6.3f}s"
+    )
+
+    print(f"construct mappings with {ENTRIES} entries")
+    for cls, data in [
+        (GRESNameMapping, gres_names(ENTRIES)),
+        (GRESNodeMapping, gres_nodes(ENTRIES)),
+    ]:
+        times = []
+        for level in VALIDATION_LEVELS:
+            with validation_level(level):
+                times.append(f"{level} {timeit(lambda: cls(data)):6.3f}s")
+        print(f"  {cls.__name__:<15}: {'  '.join(times)}")
+
+    print(f"load files with {ENTRIES} entries")
+    for editor, content in [
+        (slurmconfig, slurm_config(ENTRIES)),
+        (gresconfig, gres_config(ENTRIES)),
+    ]:
+        times = []
+        for level in VALIDATION_LEVELS:
+            times.append(
+                f"{level} {timeit(lambda: editor.loads(content, validation=level)):6.3f}s"
+            )
+        print(f"  {editor.__name__.rsplit('.', 1)[-1]:<15}: {'  '.join(times)}")
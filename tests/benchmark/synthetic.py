@@ -0,0 +1,64 @@
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Generate large synthetic configuration files for benchmarks."""
+
+import time
+from collections.abc import Callable
+
+SLURM_CONFIG_HEADER = """\
+SlurmctldHost=juju-c9fc6f-0(10.152.28.20)
+ClusterName=charmed-hpc
+AuthType=auth/munge
+PluginDir=/usr/local/lib:/usr/local/slurm/lib
+SchedulerType=sched/backfill
+SlurmctldPort=7002
+SlurmdPort=7003
+"""
+
+
+def slurm_config(nodes: int, down_nodes: int = 0) -> str:
+    """Generate a `slurm.conf` with `nodes` node lines and `down_nodes` down node lines."""
+    lines = [SLURM_CONFIG_HEADER]
+    for i in range(nodes):
+        lines.append(
+            f"NodeName=node-{i} NodeAddr=10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256} "
+            + "CPUs=128 RealMemory=512000 Sockets=2 CoresPerSocket=32 ThreadsPerCore=2 "
+            + "Features=a100,nvlink Gres=gpu:a100:8 State=UNKNOWN"
+        )
+    for i in range(down_nodes):
+        lines.append(f'DownNodes=node-{i} State=DOWN Reason="Maintenance Mode"')
+    lines.append(f"PartitionName=batch Nodes=node-[0-{max(nodes - 1, 0)}] MaxTime=120 State=UP")
+    return "\n".join(lines) + "\n"
+
+
+def gres_config(names: int, per_node: int = 8) -> str:
+    """Generate a `gres.conf` with `names` GPU lines spread `per_node` to a node."""
+    lines = ["AutoDetect=nvml"]
+    for i in range(names):
+        lines.append(
+            f"NodeName=node-{i // per_node} Name=gpu Type=a100 "
+            + f"File=/dev/nvidia{i % per_node} Cores=0,1"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def timeit(func: Callable[[], object], repeat: int = 3) -> float:
+    """Return the best wall clock time in seconds of `repeat` calls to `func`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -15,7 +15,6 @@
 
 """Unit tests for the cgroup.conf editor."""
 
-
 from constants import EXAMPLE_CGROUP_CONFIG
 from pyfakefs.fake_filesystem_unittest import TestCase
 
@@ -37,6 +36,19 @@ class TestCgroupConfigEditor(TestCase):
         self.assertEqual(config.constrain_ram_space, "yes")
         self.assertEqual(config.constrain_swap_space, "yes")
 
+    def test_loads_keys(self) -> None:
+        """Test loading only selected options with the cgroupconfig module."""
+        config = cgroupconfig.loads(EXAMPLE_CGROUP_CONFIG, keys=["ConstrainCores"])
+        self.assertDictEqual(config.dict(), {"ConstrainCores": "yes"})
+
+        config = cgroupconfig.loads(
+            "ConstrainCores=yes ConstrainDevices=yes\n", keys=["ConstrainDevices"]
+        )
+        self.assertDictEqual(config.dict(), {"ConstrainDevices": "yes"})
+
+        config = cgroupconfig.loads(EXAMPLE_CGROUP_CONFIG, keys=(k for k in ["ConstrainCores"]))
+        self.assertDictEqual(config.dict(), {"ConstrainCores": "yes"})
+
     def test_dumps(self) -> None:
         """Test `dumps` method of the cgroupconfig module."""
         config = cgroupconfig.loads(EXAMPLE_CGROUP_CONFIG)
@@ -15,15 +15,35 @@
 
 """Unit tests for base editor functions."""
 
+import asyncio
+import multiprocessing
 import os
 import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest import mock
 
-from constants import EXAMPLE_SLURM_CONFIG
+from constants import EXAMPLE_GRES_CONFIG, EXAMPLE_SLURM_CONFIG
 from pyfakefs.fake_filesystem_unittest import TestCase
 
-from slurmutils.editors import slurmconfig
+from slurmutils.editors import cache, editor, gresconfig, slurmconfig, transaction
+from slurmutils.editors.cache import ModelCache, model_cache
 from slurmutils.editors.editor import set_file_permissions
+from slurmutils.editors.lock import file_lock
+from slurmutils.models import SlurmConfig
+from slurmutils.models.model import get_validation_level, interning, validation_level
+
+
+def _increment_max_job_count(file: str, count: int) -> None:
+    """Increment `MaxJobCount` in a slurm.conf file `count` times."""
+    for _ in range(count):
+        with slurmconfig.edit(file, timeout=60) as config:
+            config.max_job_count = str(int(config.max_job_count) + 1)
 
 
 class TestBaseEditor(TestCase):
@@ -52,3 +72,392 @@ class TestBaseEditor(TestCase):
         """Test that `dumper` succeeds when there is no pre-existing config file."""
         self.fs.remove("/etc/slurm/slurm.conf")
         slurmconfig.dump(slurmconfig.loads(EXAMPLE_SLURM_CONFIG), "/etc/slurm/slurm.conf")
+
+    def test_dump_streams_lines(self) -> None:
+        """Test that `dump` writes the same content that `dumps` returns."""
+        config = slurmconfig.loads(EXAMPLE_SLURM_CONFIG)
+        slurmconfig.dump(config, "/etc/slurm/slurm.conf")
+        self.assertEqual(Path("/etc/slurm/slurm.conf").read_text(), slurmconfig.dumps(config))
+        self.assertEqual(list(config.iter_lines()), slurmconfig.dumps(config).splitlines())
+
+        config = gresconfig.loads(EXAMPLE_GRES_CONFIG)
+        gresconfig.dump(config, "/etc/slurm/gres.conf")
+        self.assertEqual(Path("/etc/slurm/gres.conf").read_text(), gresconfig.dumps(config))
+
+        gresconfig.dump(gresconfig.loads(""), "/etc/slurm/gres.conf")
+        self.assertEqual(Path("/etc/slurm/gres.conf").read_text(), "\n")
+
+    def test_atomic_write(self) -> None:
+        """Test that `atomic_write` replaces files atomically with the requested permissions."""
+        target = Path("/etc/slurm/slurm.conf")
+        for level in editor.DURABILITY_LEVELS:
+            editor.atomic_write(target, ["a", "b"], mode=0o600, durability=level)
+            self.assertEqual(target.read_text(), "a\nb")
+            self.assertEqual("-rw-------", stat.filemode(target.stat().st_mode))
+
+        # Symlinks are preserved and their target is replaced.
+        link = Path("/etc/slurm/link.conf")
+        link.symlink_to(target)
+        editor.atomic_write(link, ["c"], end="\n")
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(target.read_text(), "c\n")
+
+        # A failed write leaves the original file intact and no temporary file behind.
+        def lines():
+            yield "d"
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            editor.atomic_write(target, lines())
+        self.assertEqual(target.read_text(), "c\n")
+        self.assertListEqual(sorted(os.listdir("/etc/slurm")), ["link.conf", "slurm.conf"])
+
+        with self.assertRaises(ValueError):
+            editor.atomic_write(target, ["e"], durability="sometimes")
+        with self.assertRaises(ValueError):
+            editor.set_durability("sometimes")
+
+        with mock.patch("os.fsync") as fsync:
+            editor.set_durability("none")
+            try:
+                slurmconfig.dump(slurmconfig.loads(EXAMPLE_SLURM_CONFIG), target)
+                fsync.assert_not_called()
+                slurmconfig.dump(
+                    slurmconfig.loads(EXAMPLE_SLURM_CONFIG), target, durability="full"
+                )
+                self.assertEqual(fsync.call_count, 2)
+            finally:
+                editor.set_durability("full")
+
+    def test_edit_skips_unchanged(self) -> None:
+        """Test that `edit` only rewrites configuration files whose contents changed."""
+        target = Path("/etc/slurm/slurm.conf")
+        slurmconfig.dump(slurmconfig.loads(EXAMPLE_SLURM_CONFIG), target)
+        inode = target.stat().st_ino
+
+        with mock.patch.object(editor, "atomic_write", wraps=editor.atomic_write) as write:
+            with slurmconfig.edit(target):
+                pass
+            write.assert_not_called()
+
+        editor_ = slurmconfig.edit(target, mode=0o600)
+        with editor_ as config:
+            config.max_job_count = config.max_job_count
+        self.assertFalse(editor_.written)
+        self.assertEqual(target.stat().st_ino, inode)
+        self.assertEqual("-rw-------", stat.filemode(target.stat().st_mode))
+
+        # Changed data models are rendered once, and the rendered contents are written.
+        editor_ = slurmconfig.edit(target, mode=0o600)
+        with mock.patch.object(
+            SlurmConfig, "iter_lines", autospec=True, side_effect=SlurmConfig.iter_lines
+        ) as render:
+            with editor_ as config:
+                config.max_job_count = "20000"
+        self.assertEqual(render.call_count, 1)
+        self.assertTrue(editor_.written)
+        self.assertEqual(target.read_text(), slurmconfig.dumps(config))
+        self.assertNotEqual(target.stat().st_ino, inode)
+        self.assertEqual(slurmconfig.load(target).max_job_count, "20000")
+
+        editor_ = slurmconfig.edit(target)
+        with self.assertRaises(RuntimeError):
+            with editor_ as config:
+                config.max_job_count = "10"
+                raise RuntimeError("boom")
+        self.assertFalse(editor_.written)
+        self.assertEqual(slurmconfig.load(target).max_job_count, "20000")
+
+    def test_transaction(self) -> None:
+        """Test that `transaction` writes all configuration files or none of them."""
+        self.fs.create_file("/etc/slurm/gres.conf", contents=EXAMPLE_GRES_CONFIG)
+        slurm_edit = slurmconfig.edit("/etc/slurm/slurm.conf")
+        gres_edit = gresconfig.edit("/etc/slurm/gres.conf")
+        with transaction(slurm_edit, gres_edit) as (slurm, gres):
+            slurm.max_job_count = "20000"
+            gres.auto_detect = "rsmi"
+        self.assertTrue(slurm_edit.written)
+        self.assertTrue(gres_edit.written)
+        self.assertEqual(slurmconfig.load("/etc/slurm/slurm.conf").max_job_count, "20000")
+        self.assertEqual(gresconfig.load("/etc/slurm/gres.conf").auto_detect, "rsmi")
+
+        # Configuration files are loaded in the caller's context.
+        with interning() as table:
+            with transaction(slurmconfig.edit("/etc/slurm/slurm.conf")):
+                pass
+        self.assertGreater(len(table), 0)
+
+        # Only changed configuration files are written.
+        slurm_edit = slurmconfig.edit("/etc/slurm/slurm.conf")
+        gres_edit = gresconfig.edit("/etc/slurm/gres.conf")
+        with transaction(slurm_edit, gres_edit) as (slurm, _):
+            slurm.max_job_count = "30000"
+        self.assertTrue(slurm_edit.written)
+        self.assertFalse(gres_edit.written)
+
+        # No configuration file is written if the block raises.
+        with self.assertRaises(RuntimeError):
+            with transaction(
+                slurmconfig.edit("/etc/slurm/slurm.conf"),
+                gresconfig.edit("/etc/slurm/gres.conf"),
+            ) as (slurm, gres):
+                slurm.max_job_count = "40000"
+                gres.auto_detect = "nvml"
+                raise RuntimeError("boom")
+
+        # ... or if writing one of the configuration files fails.
+        stage_write = editor._stage_write
+        calls = []
+
+        def fail_second(*args, **kwargs):
+            calls.append(args)
+            if len(calls) > 1:
+                raise OSError("boom")
+            return stage_write(*args, **kwargs)
+
+        with mock.patch.object(editor, "_stage_write", side_effect=fail_second):
+            with self.assertRaises(OSError):
+                with transaction(
+                    slurmconfig.edit("/etc/slurm/slurm.conf"),
+                    gresconfig.edit("/etc/slurm/gres.conf"),
+                ) as (slurm, gres):
+                    slurm.max_job_count = "40000"
+                    gres.auto_detect = "nvml"
+
+        self.assertEqual(slurmconfig.load("/etc/slurm/slurm.conf").max_job_count, "30000")
+        self.assertEqual(gresconfig.load("/etc/slurm/gres.conf").auto_detect, "rsmi")
+        self.assertListEqual(
+            sorted(f for f in os.listdir("/etc/slurm") if not f.endswith(".lock")),
+            ["gres.conf", "slurm.conf"],
+        )
+
+        with self.assertRaises(ValueError):
+            with transaction(
+                slurmconfig.edit("/etc/slurm/slurm.conf"),
+                slurmconfig.edit("/etc/slurm/slurm.conf"),
+            ):
+                pass
+
+    def test_model_cache(self) -> None:
+        """Test that `loader` caches data models until the file changes."""
+        model_cache.invalidate()
+        self.assertEqual(model_cache.max_entries, 0)
+        model_cache.max_entries = 32
+        self.addCleanup(setattr, model_cache, "max_entries", 0)
+        hits, misses = model_cache.hits, model_cache.misses
+        config = slurmconfig.load("/etc/slurm/slurm.conf")
+        cached = slurmconfig.load("/etc/slurm/slurm.conf")
+        self.assertEqual(model_cache.hits - hits, 1)
+        self.assertEqual(model_cache.misses - misses, 1)
+        self.assertEqual(str(cached), str(config))
+
+        # Cached data models are independent copies.
+        cached.cluster_name = "changed"
+        self.assertEqual(slurmconfig.load("/etc/slurm/slurm.conf").cluster_name, "charmed-hpc")
+
+        # Cache entries are keyed by the arguments passed to the loader.
+        partial = slurmconfig.load("/etc/slurm/slurm.conf", keys=["ClusterName"])
+        self.assertIsNone(partial.auth_type)
+
+        # Loads that intern values bypass the cache, and entries are keyed by validation level.
+        model_cache.invalidate()
+        with interning():
+            slurmconfig.load("/etc/slurm/slurm.conf")
+        self.assertEqual(len(model_cache), 0)
+        with validation_level("off"):
+            slurmconfig.load("/etc/slurm/slurm.conf")
+        slurmconfig.load("/etc/slurm/slurm.conf")
+        self.assertEqual(len(model_cache), 2)
+
+        # Changing the file invalidates the cache entry.
+        Path("/etc/slurm/slurm.conf").write_text("ClusterName=other\n")
+        self.assertEqual(slurmconfig.load("/etc/slurm/slurm.conf").cluster_name, "other")
+
+        model_cache.invalidate("/etc/slurm/slurm.conf")
+        self.assertEqual(len(model_cache), 0)
+
+    def test_model_cache_eviction(self) -> None:
+        """Test that `ModelCache` evicts least recently used entries."""
+        cache = ModelCache(max_entries=2)
+        for i in range(3):
+            cache.put(i, f"/file{i}", (0, 0, 0), {"i": i})
+        self.assertIsNone(cache.get(0, (0, 0, 0)))
+        self.assertEqual(cache.get(1, (0, 0, 0)), {"i": 1})
+        self.assertIsNone(cache.get(1, (0, 0, 1)))
+
+        cache = ModelCache(max_entries=32, max_bytes=cache.size // 2 + 1)
+        cache.put(1, "/file1", (0, 0, 0), {"i": 1})
+        cache.put(2, "/file2", (0, 0, 0), {"i": 2})
+        self.assertEqual(len(cache), 1)
+
+    def test_model_cache_snapshots(self) -> None:
+        """Test that `loader` persists and reuses on-disk snapshots."""
+        model_cache.invalidate()
+        model_cache.snapshot_dir = "/var/cache/slurmutils"
+        self.addCleanup(setattr, model_cache, "snapshot_dir", None)
+        snapshot_hits = model_cache.snapshot_hits
+
+        config = slurmconfig.load("/etc/slurm/slurm.conf")
+        self.assertEqual(len(os.listdir("/var/cache/slurmutils")), 1)
+        model_cache.invalidate()
+        self.assertEqual(str(slurmconfig.load("/etc/slurm/slurm.conf")), str(config))
+        self.assertEqual(model_cache.snapshot_hits - snapshot_hits, 1)
+
+        # Snapshots are ignored if the file contents or the slurmutils version changes.
+        model_cache.invalidate()
+        Path("/etc/slurm/slurm.conf").write_text("ClusterName=other\n")
+        self.assertEqual(slurmconfig.load("/etc/slurm/slurm.conf").cluster_name, "other")
+        self.assertEqual(model_cache.snapshot_hits - snapshot_hits, 1)
+
+        model_cache.invalidate()
+        with mock.patch.object(cache, "_SNAPSHOT_STAMP", b"slurmutils-snapshot/0"):
+            slurmconfig.load("/etc/slurm/slurm.conf")
+        self.assertEqual(model_cache.snapshot_hits - snapshot_hits, 1)
+
+        # Snapshots that other users can modify are never unpickled.
+        model_cache.invalidate()
+        slurmconfig.load("/etc/slurm/slurm.conf")
+        snapshot_hits = model_cache.snapshot_hits
+        snapshot = os.path.join("/var/cache/slurmutils", os.listdir("/var/cache/slurmutils")[0])
+        for path, mode in [("/var/cache/slurmutils", 0o777), (snapshot, 0o666)]:
+            os.chmod(path, mode)
+            model_cache.invalidate()
+            slurmconfig.load("/etc/slurm/slurm.conf")
+            self.assertEqual(model_cache.snapshot_hits, snapshot_hits)
+            os.chmod(path, 0o700 if path != snapshot else 0o600)
+        with mock.patch.object(os, "geteuid", return_value=os.geteuid() + 1):
+            model_cache.invalidate()
+            slurmconfig.load("/etc/slurm/slurm.conf")
+            self.assertEqual(model_cache.snapshot_hits, snapshot_hits)
+        model_cache.invalidate()
+        slurmconfig.load("/etc/slurm/slurm.conf")
+        self.assertEqual(model_cache.snapshot_hits, snapshot_hits + 1)
+
+        # Files are parsed from the contents that were hashed rather than read again.
+        model_cache.invalidate()
+        Path("/etc/slurm/slurm.conf").write_text("ClusterName=new\n")
+        with mock.patch.object(slurmconfig, "open", create=True, side_effect=AssertionError):
+            self.assertEqual(slurmconfig.load("/etc/slurm/slurm.conf").cluster_name, "new")
+
+
+class TestFileLock(unittest.TestCase):
+    """Unit tests for advisory locking of configuration files."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.tmpdir.name, "slurm.conf")
+        Path(self.file).write_text(EXAMPLE_SLURM_CONFIG)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_concurrent_edits(self) -> None:
+        """Test that concurrent `edit` calls from several processes lose no updates."""
+        start = int(slurmconfig.load(self.file).max_job_count)
+        ctx = multiprocessing.get_context("fork")
+        workers = [
+            ctx.Process(target=_increment_max_job_count, args=(self.file, 25)) for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+
+        self.assertEqual(int(slurmconfig.load(self.file).max_job_count), start + 100)
+
+    def test_lock_modes(self) -> None:
+        """Test that shared locks coexist and exclusive locks time out."""
+        errors = []
+
+        def lock(shared: bool) -> None:
+            try:
+                with file_lock(self.file, shared=shared, timeout=0.05):
+                    pass
+            except TimeoutError as e:
+                errors.append(e)
+
+        def run(shared: bool) -> None:
+            thread = threading.Thread(target=lock, args=(shared,))
+            thread.start()
+            thread.join()
+
+        with file_lock(self.file, shared=True):
+            run(shared=True)
+            self.assertListEqual(errors, [])
+            run(shared=False)
+            self.assertEqual(len(errors), 1)
+            # Locks are reentrant within a thread, but cannot be upgraded.
+            with file_lock(self.file, shared=True):
+                pass
+            with self.assertRaises(RuntimeError):
+                with file_lock(self.file):
+                    pass
+
+        with slurmconfig.edit(self.file):
+            run(shared=True)
+            self.assertEqual(len(errors), 2)
+            # `load` takes a shared lock, so it can run inside of an edit in the same thread.
+            slurmconfig.load(self.file)
+
+        run(shared=False)
+        self.assertEqual(len(errors), 2)
+
+    def test_async_editor(self) -> None:
+        """Test that concurrent `aedit` calls on a small executor lose no updates."""
+
+        async def increment() -> None:
+            async with slurmconfig.aedit(self.file, timeout=60) as config:
+                config.max_job_count = str(int(config.max_job_count) + 1)
+
+        async def main() -> None:
+            start = int((await slurmconfig.aload(self.file)).max_job_count)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                editor.set_executor(pool)
+                try:
+                    await asyncio.gather(*(increment() for _ in range(20)))
+                finally:
+                    editor.set_executor(None)
+
+            config = await slurmconfig.aload(self.file, keys=["MaxJobCount"])
+            self.assertEqual(int(config.max_job_count), start + 20)
+
+            config = await slurmconfig.aload(self.file)
+            config.max_job_count = "1"
+            await slurmconfig.adump(config, self.file, durability="none")
+            ctx = slurmconfig.aedit(self.file)
+            async with ctx as config:
+                self.assertEqual(config.max_job_count, "1")
+            self.assertFalse(ctx.written)
+
+            async with slurmconfig.aedit(self.file):
+                with self.assertRaises(TimeoutError):
+                    async with slurmconfig.aedit(self.file, timeout=0.05):
+                        pass
+
+            # Blocking calls run in the context of the caller.
+            with validation_level("off"):
+                self.assertEqual(await editor.run_in_executor(get_validation_level), "off")
+
+        asyncio.run(main())
+
+
+class TestImports(unittest.TestCase):
+    """Unit tests for lazily importing editors and their dependencies."""
+
+    def test_lazy_imports(self) -> None:
+        """Test that importing one editor does not import unrelated modules."""
+        script = (
+            "import sys\n"
+            + "import slurmutils\n"
+            + "assert 'slurmutils.editors' not in sys.modules\n"
+            + "from slurmutils.editors import cgroupconfig\n"
+            + "config = cgroupconfig.loads('ConstrainCores=yes')\n"
+            + "print(sorted(m for m in sys.modules if m.startswith(('slurmutils.', 'jsonschema'))))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertIn("slurmutils.models.cgroup", out)
+        for module in ["jsonschema", "slurmutils.models.slurm", "slurmutils.editors.slurmconfig"]:
+            self.assertNotIn(f"'{module}'", out)
@@ -73,6 +73,28 @@ class TestGRESConfigEditor(TestCase):
             },
         )
 
+    def test_loads_sections(self) -> None:
+        """Test loading only selected parts with the `gresconfig` editor module."""
+        config = gresconfig.loads(EXAMPLE_GRES_CONFIG, sections=["Nodes"])
+        self.assertIsNone(config.auto_detect)
+        self.assertDictEqual(config.names.dict(), {})
+        self.assertListEqual(list(config.nodes), ["juju-abc654-1"])
+
+        config = gresconfig.load("/etc/slurm/gres.conf", keys=["AutoDetect"])
+        self.assertEqual(config.auto_detect, "nvml")
+        self.assertDictEqual(config.names.dict(), {})
+        self.assertDictEqual(config.nodes.dict(), {})
+
+    def test_loads_validation(self) -> None:
+        """Test loading with the validation levels of the `gresconfig` editor module."""
+        expected = gresconfig.dumps(gresconfig.loads(EXAMPLE_GRES_CONFIG))
+        for level in ["strict", "fast", "off"]:
+            config = gresconfig.load("/etc/slurm/gres.conf", validation=level)
+            self.assertEqual(gresconfig.dumps(config), expected)
+
+        with self.assertRaises(ValueError):
+            gresconfig.loads(EXAMPLE_GRES_CONFIG, validation="lenient")
+
     def test_dumps(self) -> None:
         """Test `dumps` function from the `gresconfig` editor module."""
         config = gresconfig.loads(EXAMPLE_GRES_CONFIG)
@@ -15,12 +15,13 @@
 
 """Unit tests for the slurm.conf editor."""
 
+import io
 
 from constants import EXAMPLE_SLURM_CONFIG
 from pyfakefs.fake_filesystem_unittest import TestCase
 
 from slurmutils.editors import slurmconfig
-from slurmutils.models import DownNodes, Node, Partition
+from slurmutils.models import DownNodes, Node, Partition, SlurmConfig
 
 
 class TestSlurmConfigEditor(TestCase):
@@ -65,6 +66,92 @@ class TestSlurmConfigEditor(TestCase):
             batch["Nodes"], ["juju-c9fc6f-2", "juju-c9fc6f-3", "juju-c9fc6f-4", "juju-c9fc6f-5"]
         )
 
+    def test_iter_records(self) -> None:
+        """Test streaming records out of a slurm.conf file."""
+        records = list(SlurmConfig.iter_records(io.StringIO(EXAMPLE_SLURM_CONFIG)))
+        nodes = [record for record in records if isinstance(record, Node)]
+        self.assertListEqual(
+            [node.node_name for node in nodes],
+            ["juju-c9fc6f-2", "juju-c9fc6f-3", "juju-c9fc6f-4", "juju-c9fc6f-5"],
+        )
+        self.assertEqual(sum(isinstance(record, DownNodes) for record in records), 1)
+        self.assertEqual(sum(isinstance(record, Partition) for record in records), 2)
+        self.assertEqual(
+            str(SlurmConfig.from_records(records)),
+            str(slurmconfig.loads(EXAMPLE_SLURM_CONFIG)),
+        )
+
+        config = SlurmConfig.from_records(
+            SlurmConfig.iter_records(["Include /etc/slurm/nodes.conf\n", "Include extra.conf\n"])
+        )
+        self.assertListEqual(config.include, ["/etc/slurm/nodes.conf", "extra.conf"])
+        self.assertEqual(str(config), "Include /etc/slurm/nodes.conf\nInclude extra.conf")
+
+        # `SlurmctldHost` set on a line of other global options is a single value.
+        config = SlurmConfig.from_records(
+            SlurmConfig.iter_records(["SlurmctldHost=h0\n", "ClusterName=c SlurmctldHost=h1\n"])
+        )
+        self.assertListEqual(config.slurmctld_host, ["h0", "h1"])
+        self.assertEqual(str(config), "SlurmctldHost=h0\nSlurmctldHost=h1\nClusterName=c")
+
+    def test_loads_lazy(self) -> None:
+        """Test lazily loading sections of a slurm.conf file."""
+        eager = slurmconfig.loads(EXAMPLE_SLURM_CONFIG)
+        config = slurmconfig.loads(EXAMPLE_SLURM_CONFIG, lazy=True)
+        self.assertEqual(config.cluster_name, "charmed-hpc")
+        self.assertNotIn("Nodes", config.data)
+        # Untouched sections are written back verbatim.
+        self.assertIn(
+            "PartitionName=batch Nodes=juju-c9fc6f-2,juju-c9fc6f-3,juju-c9fc6f-4,juju-c9fc6f-5 "
+            + "MinNodes=4 MaxTime=120 AllowGroups=admin",
+            slurmconfig.dumps(config),
+        )
+
+        self.assertDictEqual(config.nodes, eager.nodes)
+        self.assertListEqual(config.down_nodes, eager.down_nodes)
+        config.partitions = {}
+        self.assertDictEqual(config.dict(), {**eager.dict(), "Partitions": {}})
+        self.assertNotIn("PartitionName", slurmconfig.dumps(config))
+
+        # Merging other sections leaves untouched lazy sections undecoded.
+        config = slurmconfig.loads(EXAMPLE_SLURM_CONFIG, lazy=True)
+        config.update(SlurmConfig(Partitions={"debug": {"MaxTime": "30"}}))
+        self.assertNotIn("Nodes", config.data)
+        self.assertDictEqual(config.partitions["debug"], {"MaxTime": "30"})
+        self.assertDictEqual(config.nodes, eager.nodes)
+
+    def test_load_sections(self) -> None:
+        """Test loading only selected parts of a slurm.conf file."""
+        config = slurmconfig.load(
+            "/etc/slurm/slurm.conf", sections=["Partitions"], keys=["ClusterName", "SlurmctldHost"]
+        )
+        self.assertEqual(config.cluster_name, "charmed-hpc")
+        self.assertEqual(len(config.slurmctld_host), 2)
+        self.assertIsNone(config.auth_type)
+        self.assertDictEqual(config.nodes, {})
+        self.assertListEqual(config.down_nodes, [])
+        self.assertListEqual(list(config.partitions), ["DEFAULT", "batch"])
+
+        config = slurmconfig.loads(EXAMPLE_SLURM_CONFIG, sections=["Nodes"])
+        self.assertListEqual([k for k, v in config.dict().items() if v], ["Nodes"])
+
+        config = slurmconfig.loads("ClusterName=c SlurmctldPort=7002\n", keys=["SlurmctldPort"])
+        self.assertEqual(config.slurmctld_port, "7002")
+        self.assertIsNone(config.cluster_name)
+
+    def test_routing(self) -> None:
+        """Test that lines are routed to sections by their exact leading key."""
+        config = slurmconfig.loads(
+            "FrontendName=frontend-0 FrontendAddr=10.152.28.10\n"
+            + "NodeSet=gpus Feature=a100\n"
+            + "NodeFeaturesPlugins=node_features/helpers\n"
+        )
+        self.assertDictEqual(
+            config.frontend_nodes, {"frontend-0": {"FrontendAddr": "10.152.28.10"}}
+        )
+        self.assertDictEqual(config.node_sets, {"gpus": {"Feature": "a100"}})
+        self.assertEqual(config.node_features_plugins, "node_features/helpers")
+
     def test_dumps(self) -> None:
         """Test `dumps` method of the slurmconfig module."""
         config = slurmconfig.loads(EXAMPLE_SLURM_CONFIG)
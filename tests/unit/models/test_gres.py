@@ -15,8 +15,10 @@
 
 from unittest import TestCase
 
+from slurmutils.exceptions import ModelError
 from slurmutils.models import GRESConfig, GRESName, GRESNode
 from slurmutils.models.gres import GRESNameMapping, GRESNodeMapping
+from slurmutils.models.schema import GRES_NAME_MAPPING_SCHEMA, validator
 
 
 class TestGRESConfig(TestCase):
@@ -62,6 +64,26 @@ class TestGRESConfig(TestCase):
         self.assertEqual(self.config.nodes, GRESNodeMapping())
 
 
+class TestGRESConfigValidation(TestCase):
+    """Unit tests for validating and copying `gres.conf` data model content."""
+
+    def test_duplicates(self) -> None:
+        """Test that duplicate gres.conf lines are rejected."""
+        line = "Name=gpu Type=a100 File=/dev/nvidia0"
+        GRESConfig.from_str(line)
+        with self.assertRaises(ModelError):
+            GRESConfig.from_str(f"{line}\n{line}")
+
+    def test_copy(self) -> None:
+        """Test that `GRESConfig` does not share mappings passed to it."""
+        names = GRESNameMapping({"gpu": [{"Name": "gpu", "File": "/dev/nvidia0"}]})
+        config = GRESConfig(Names=names)
+        config.names["mps"] = []
+        config.names["gpu"][0].file = "/dev/nvidia1"
+        self.assertListEqual(list(names), ["gpu"])
+        self.assertEqual(names["gpu"][0].file, "/dev/nvidia0")
+
+
 class TestGRESName(TestCase):
     """Unit tests for `GRESName` data model."""
 
@@ -156,3 +178,26 @@ class TestGRESNode(TestCase):
         # Ensure that `NodeName` cannot be deleted.
         with self.assertRaises(AttributeError):
             del self.config.node_name  # noqa
+
+
+class TestGRESMapping(TestCase):
+    """Unit tests for validating `gres.conf` data model mappings."""
+
+    def test_validate(self) -> None:
+        """Test that mappings are validated with a cached validator."""
+        self.assertIs(validator(GRES_NAME_MAPPING_SCHEMA), validator(GRES_NAME_MAPPING_SCHEMA))
+
+        gpus = [{"Name": "gpu", "File": f"/dev/nvidia{i}"} for i in range(3)]
+        mapping = GRESNameMapping({"gpu": gpus})
+        self.assertIsInstance(mapping["gpu"][2], GRESName)
+        self.assertDictEqual(mapping.dict(), {"gpu": gpus})
+        # Entries are built from a copy of the input mapping.
+        self.assertIsInstance(gpus[0], dict)
+        mapping["gpu"][0].file = "/dev/nvidia9"
+        self.assertEqual(gpus[0]["File"], "/dev/nvidia0")
+        with self.assertRaises(ModelError):
+            GRESNameMapping({"gpu": [*gpus, {"File": "/dev/nvidia0", "Name": "gpu"}]})
+        with self.assertRaises(ModelError):
+            GRESNodeMapping({"node-0": [{"NodeName": "node-0", "Cores": ["0", "0"]}]})
+        with self.assertRaises(ModelError):
+            GRESNodeMapping({"node-0": [{"NodeName": "node-0", "Count": 1}]})
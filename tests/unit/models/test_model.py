@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for base data model functions."""
+
+import shlex
+from unittest import TestCase
+
+from slurmutils.exceptions import ModelError
+from slurmutils.models.gres import GRESNameMapping
+from slurmutils.models.model import (
+    InternTable,
+    Option,
+    clean,
+    copy_data,
+    interning,
+    parse_line,
+    set_intern_table,
+    set_validation_level,
+    tokenize,
+    validation_level,
+)
+from slurmutils.models.option import NodeOptionSet, SlurmConfigOptionSet
+from slurmutils.models.slurm import Node, SlurmConfig
+
+
+class TestTokenize(TestCase):
+    """Unit tests for the configuration line lexer."""
+
+    def test_tokenize_matches_shlex(self) -> None:
+        """Test that `tokenize` splits lines the same way as `shlex.split`."""
+        lines = [
+            "NodeName=juju-c9fc6f-2 NodeAddr=10.152.28.48 CPUs=1  RealMemory=1000",
+            'DownNodes=juju-c9fc6f-5 State=DOWN Reason="Maintenance Mode"',
+            "Reason='single quoted' State=DOWN",
+            r'Reason="escaped \"quote\"" State=DOWN',
+            r"Reason=escaped\ space",
+            'Reason="" State=DOWN',
+            "   ",
+        ]
+        for line in lines:
+            self.assertListEqual(tokenize(line), shlex.split(line))
+
+    def test_tokenize_comments(self) -> None:
+        """Test that `tokenize` strips inline comments unless `#` is escaped."""
+        self.assertListEqual(
+            tokenize("CPUs=1 RealMemory=1000 # comment"), ["CPUs=1", "RealMemory=1000"]
+        )
+        self.assertListEqual(tokenize(r"Reason=ticket\#42"), ["Reason=ticket#42"])
+        self.assertEqual(clean("# comment"), None)
+        self.assertEqual(clean(r"Reason=ticket\#42 # comment"), r"Reason=ticket\#42 ")
+
+    def test_escaped_comment_round_trip(self) -> None:
+        """Test that escaped `#` characters survive loading and dumping configuration."""
+        content = "\n".join(
+            [
+                r"SlurmctldParameters=ticket\#42",
+                r'DownNodes=node-0 State=DOWN Reason="ticket \#42"',
+                r"PartitionName=p1 Nodes=ALL AllowAccounts=acct\#1",
+            ]
+        )
+        config = SlurmConfig.from_str(content)
+        self.assertEqual(config.down_nodes[0]["Reason"], "ticket #42")
+        self.assertEqual(config.partitions["p1"]["AllowAccounts"], ["acct#1"])
+        dumped = str(config)
+        self.assertEqual(dumped, content)
+        self.assertDictEqual(SlurmConfig.from_str(dumped).dict(), config.dict())
+
+    def test_tokenize_fail(self) -> None:
+        """Test that `tokenize` fails on unbalanced quotes and dangling escapes."""
+        with self.assertRaises(ModelError):
+            tokenize('Reason="Maintenance Mode')
+        with self.assertRaises(ModelError):
+            tokenize("Reason=Maintenance\\")
+
+    def test_parse_line(self) -> None:
+        """Test that `parse_line` parses quoted values."""
+        data = parse_line(NodeOptionSet, 'NodeName=node-0 Features=a,b Reason="Bad disk"')
+        self.assertDictEqual(
+            data, {"NodeName": "node-0", "Features": ["a", "b"], "Reason": "Bad disk"}
+        )
+
+
+class TestOptionSet(TestCase):
+    """Unit tests for configuration option sets."""
+
+    def test_callbacks(self) -> None:
+        """Test that `callbacks` maps every option to its callback and is read-only."""
+        self.assertListEqual(list(NodeOptionSet.callbacks), list(NodeOptionSet.keys()))
+        self.assertIs(NodeOptionSet.callbacks["Features"], NodeOptionSet.Features)
+        with self.assertRaises(TypeError):
+            NodeOptionSet.callbacks["Features"] = None  # type: ignore
+
+    def test_parse_line_fail(self) -> None:
+        """Test that `parse_line` fails on unknown configuration options."""
+        with self.assertRaises(ModelError):
+            parse_line(NodeOptionSet, "NodeName=node-0 keys=a")
+
+
+class TestInterning(TestCase):
+    """Unit tests for interning parsed configuration values."""
+
+    def test_interning(self) -> None:
+        """Test that repeated values parsed within `interning` share one object."""
+        lines = [
+            f"NodeName=node-{i} CPUs=128 Features=a100,nvlink State=UNKNOWN" for i in range(3)
+        ]
+        plain = [parse_line(NodeOptionSet, line) for line in lines]
+        self.assertIsNot(plain[0]["Features"], plain[1]["Features"])
+
+        with interning() as table:
+            nodes = [parse_line(NodeOptionSet, line) for line in lines]
+
+        self.assertEqual(len(table), 6)
+        self.assertTupleEqual(nodes[0]["Features"], ("a100", "nvlink"))
+        for k in ["CPUs", "Features", "State"]:
+            self.assertIs(nodes[0][k], nodes[2][k])
+        self.assertIsNot(nodes[0]["NodeName"], nodes[1]["NodeName"])
+        for node, expected in zip(nodes, plain):
+            self.assertDictEqual(
+                {k: list(v) if isinstance(v, tuple) else v for k, v in node.items()}, expected
+            )
+
+        # Interning stops outside of the block.
+        self.assertIsInstance(parse_line(NodeOptionSet, lines[0])["Features"], list)
+
+    def test_bounded(self) -> None:
+        """Test that full intern tables still share the values they already hold."""
+        table = InternTable(max_size=2)
+        with interning(table):
+            first = [parse_line(NodeOptionSet, f"NodeName=a CPUs={i}000") for i in range(4)]
+            second = [parse_line(NodeOptionSet, f"NodeName=a CPUs={i}000") for i in range(4)]
+
+        self.assertEqual(len(table), 2)
+        self.assertIs(first[0]["CPUs"], second[0]["CPUs"])
+        self.assertIsNot(first[3]["CPUs"], second[3]["CPUs"])
+        table.clear()
+        self.assertEqual(len(table), 0)
+
+    def test_option_sets(self) -> None:
+        """Test that options parsed differently by different option sets are not shared."""
+        content = "PartitionName=p1 PreemptMode=OFF Nodes=ALL\nPreemptMode=OFF"
+        with interning():
+            config = SlurmConfig.from_str(content)
+
+        self.assertEqual(config.partitions["p1"]["PreemptMode"], "OFF")
+        self.assertListEqual(list(config.preempt_mode), ["OFF"])
+        self.assertEqual(str(config), str(SlurmConfig.from_str(content)))
+
+    def test_process_wide(self) -> None:
+        """Test that the process-wide intern table is used outside of `interning`."""
+        set_intern_table(InternTable())
+        try:
+            line = "AuthAltParameters=jwt_key=/etc/slurm/jwt.key"
+            a = parse_line(SlurmConfigOptionSet, line)
+            b = parse_line(SlurmConfigOptionSet, line)
+        finally:
+            set_intern_table(None)
+
+        # Mutable values are not shared between data models.
+        self.assertEqual(a, b)
+        self.assertIsNot(a["AuthAltParameters"], b["AuthAltParameters"])
+
+
+class TestCopyData(TestCase):
+    """Unit tests for copying data out of data models."""
+
+    def test_copy_data(self) -> None:
+        """Test that `copy_data` copies containers but shares immutable values."""
+        data = {"Nodes": {"node-0": {"CPUs": "128", "Features": ["a100"]}}, "Hosts": {"a"}}
+        clone = copy_data(data)
+        self.assertDictEqual(clone, data)
+        self.assertIs(clone["Nodes"]["node-0"]["CPUs"], data["Nodes"]["node-0"]["CPUs"])
+
+        clone["Nodes"]["node-0"]["Features"].append("nvlink")
+        clone["Nodes"]["node-1"] = {}
+        clone["Hosts"].add("b")
+        self.assertDictEqual(
+            data, {"Nodes": {"node-0": {"CPUs": "128", "Features": ["a100"]}}, "Hosts": {"a"}}
+        )
+
+
+class TestOption(TestCase):
+    """Unit tests for the configuration option descriptor."""
+
+    def test_option(self) -> None:
+        """Test that `Option` descriptors read and write the data of a data model."""
+        self.assertIsInstance(SlurmConfig.slurmctld_port, Option)
+        self.assertIs(SlurmConfig.slurmctld_port, SlurmConfig.__dict__["slurmctld_port"])
+
+        config = SlurmConfig()
+        self.assertIsNone(config.slurmctld_port)
+        config.slurmctld_port = "6817"
+        self.assertEqual(config.data["SlurmctldPort"], "6817")
+        del config.slurmctld_port
+        self.assertNotIn("SlurmctldPort", config.data)
+        with self.assertRaises(KeyError):
+            del config.slurmctld_port
+
+
+class TestValidationLevel(TestCase):
+    """Unit tests for data model validation levels."""
+
+    def test_levels(self) -> None:
+        """Test that validation levels control which checks data models run."""
+        with self.assertRaises(ModelError):
+            Node(NodeName="node-0", Bogus="1")
+        with self.assertRaises(ModelError):
+            GRESNameMapping({"gpu": [{"Name": "gpu", "Count": 1}]})
+
+        with validation_level("fast") as level:
+            self.assertEqual(level, "fast")
+            GRESNameMapping({"gpu": [{"Name": "gpu", "Count": 1}]})
+            with self.assertRaises(ModelError):
+                GRESNameMapping({"gpu": {"Name": "gpu"}})
+            with self.assertRaises(ModelError):
+                GRESNameMapping({"gpu": [{"Name": "gpu", "Bogus": "1"}]})
+
+        with validation_level("off"):
+            self.assertDictEqual(Node(NodeName="node-0", Bogus="1").data, {"Bogus": "1"})
+            mapping = GRESNameMapping({"gpu": [{"Name": "gpu", "Bogus": "1"}]})
+            self.assertDictEqual(mapping["gpu"][0].data, {"Name": "gpu", "Bogus": "1"})
+
+        set_validation_level("off")
+        try:
+            Node(NodeName="node-0", Bogus="1")
+            with validation_level(None) as level:
+                self.assertEqual(level, "off")
+            with validation_level("strict"), self.assertRaises(ModelError):
+                Node(NodeName="node-0", Bogus="1")
+        finally:
+            set_validation_level("strict")
+
+        with self.assertRaises(ValueError):
+            set_validation_level("lenient")
+        with self.assertRaises(ValueError), validation_level("lenient"):
+            pass
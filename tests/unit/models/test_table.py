@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the columnar node table."""
+
+import copy
+import pickle
+from unittest import TestCase
+
+from slurmutils.models import NodeTable, SlurmConfig
+
+EXAMPLE_NODES = {
+    "node-0": {"NodeAddr": "10.0.0.0", "CPUs": "128", "Features": ["a100", "nvlink"]},
+    "node-1": {"NodeAddr": "10.0.0.1", "CPUs": "128", "Features": ["a100", "nvlink"]},
+    "node-2": {"NodeAddr": "10.0.0.2", "CPUs": "64", "State": "UNKNOWN"},
+}
+
+
+class TestNodeTable(TestCase):
+    """Unit tests for the `NodeTable` class."""
+
+    def test_mapping(self) -> None:
+        """Test that `NodeTable` behaves like a dictionary of node options."""
+        table = NodeTable(EXAMPLE_NODES)
+        self.assertEqual(len(table), 3)
+        self.assertListEqual(list(table), ["node-0", "node-1", "node-2"])
+        self.assertEqual(table, EXAMPLE_NODES)
+        self.assertDictEqual(table.dict(), EXAMPLE_NODES)
+        self.assertNotIn("node-3", table)
+        with self.assertRaises(KeyError):
+            table["node-3"]
+
+        # Rows are mutable views into the table.
+        node = table["node-2"]
+        node["CPUs"] = "32"
+        del node["State"]
+        self.assertDictEqual(dict(table["node-2"]), {"NodeAddr": "10.0.0.2", "CPUs": "32"})
+        with self.assertRaises(KeyError):
+            node["State"]
+
+        # List values are copies, so mutating them does not change the table.
+        table["node-0"]["Features"].append("ib")
+        self.assertListEqual(table["node-0"]["Features"], ["a100", "nvlink"])
+
+        # Repeated values share a single category.
+        self.assertEqual(len(table._columns["Features"].values), 2)
+
+        table["node-1"] = {"CPUs": "16"}
+        self.assertDictEqual(dict(table["node-1"]), {"CPUs": "16"})
+        table["node-1"] = table["node-1"]
+        self.assertDictEqual(dict(table["node-1"]), {"CPUs": "16"})
+
+    def test_order(self) -> None:
+        """Test that `NodeTable` keeps the order of the options of each node."""
+        nodes = {
+            "node-0": {"NodeAddr": "10.0.0.0", "CPUs": "128"},
+            "node-1": {"CPUs": "64", "State": "UNKNOWN", "NodeAddr": "10.0.0.1"},
+        }
+        table = NodeTable(nodes)
+        self.assertListEqual(list(table["node-1"]), ["CPUs", "State", "NodeAddr"])
+        self.assertListEqual([list(v) for _, v in table.rows()], [list(v) for v in nodes.values()])
+
+        node = table["node-1"]
+        del node["CPUs"]
+        node["Weight"] = "1"
+        node["State"] = "IDLE"
+        self.assertListEqual(list(node), ["State", "NodeAddr", "Weight"])
+        self.assertListEqual(list(table["node-0"]), ["NodeAddr", "CPUs"])
+
+    def test_delete(self) -> None:
+        """Test that deleted nodes are dropped and their rows are compacted."""
+        table = NodeTable({f"node-{i}": {"CPUs": str(i)} for i in range(10)})
+        view = table["node-9"]
+        for i in range(8):
+            del table[f"node-{i}"]
+
+        self.assertListEqual(list(table), ["node-8", "node-9"])
+        self.assertLess(len(table._names), 10)
+        self.assertEqual(view["CPUs"], "9")
+        table["node-0"] = {"CPUs": "0"}
+        self.assertListEqual(list(table), ["node-8", "node-9", "node-0"])
+
+    def test_copy(self) -> None:
+        """Test that `NodeTable` can be pickled and deep copied."""
+        table = NodeTable(EXAMPLE_NODES)
+        self.assertEqual(pickle.loads(pickle.dumps(table)), table)
+        clone = copy.deepcopy(table)
+        clone["node-0"]["CPUs"] = "1"
+        self.assertEqual(table["node-0"]["CPUs"], "128")
+
+    def test_slurm_config(self) -> None:
+        """Test that `SlurmConfig` produces the same output with a columnar node store."""
+        content = "\n".join(
+            [
+                "ClusterName=charmed-hpc",
+                "NodeName=node-0 NodeAddr=10.0.0.0 CPUs=128 Features=a100,nvlink",
+                "NodeName=node-1 NodeAddr=10.0.0.1 CPUs=128 Features=a100,nvlink",
+                "NodeName=node-2 CPUs=64 NodeAddr=10.0.0.2",
+                "PartitionName=batch Nodes=node-[0-2] State=UP",
+            ]
+        )
+        expected = SlurmConfig.from_str(content)
+        for lazy in (False, True):
+            config = SlurmConfig.from_str(content, columnar=True, lazy=lazy)
+            self.assertIsInstance(config.nodes, NodeTable)
+            self.assertEqual(str(config), content)
+            self.assertDictEqual(config.dict(), expected.dict())
+
+        config.update(SlurmConfig(Nodes={"node-1": {"CPUs": "64"}, "node-3": {"CPUs": "8"}}))
+        self.assertIsInstance(config.nodes, NodeTable)
+        self.assertEqual(config.nodes["node-1"]["CPUs"], "64")
+        self.assertEqual(config.nodes["node-1"]["NodeAddr"], "10.0.0.1")
+        self.assertDictEqual(dict(config.nodes["node-3"]), {"CPUs": "8"})